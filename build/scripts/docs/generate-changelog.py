@@ -21,6 +21,10 @@ to a dedicated Breaking Changes section at the top of the output.
 
 Non-conventional commits are categorized under "Other".
 
+When ``--output`` is given, the rendered changelog is memoized under
+``.cache/changelog/`` keyed by ``HEAD`` and the CLI arguments, so re-running
+against an unchanged commit copies the cached file instead of regenerating.
+
 Usage:
     python3 generate-changelog.py --output docs/status/CHANGELOG.md
     python3 generate-changelog.py --recent 100 --since 2025-01-01
@@ -28,14 +32,14 @@ Usage:
 """
 
 import argparse
+import hashlib
 import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, NamedTuple, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +72,9 @@ CATEGORY_ORDER: list[str] = [
     "Other",
 ]
 
+# Set view of CATEGORY_ORDER for O(1) membership tests.
+_CATEGORY_ORDER_SET: frozenset[str] = frozenset(CATEGORY_ORDER)
+
 # Regex that matches a conventional-commit subject line.
 # Group 1: type, Group 2: optional scope (without parens), Group 3: message.
 CONVENTIONAL_RE = re.compile(
@@ -85,14 +92,28 @@ PR_ISSUE_RE = re.compile(r"#(\d+)")
 # Sentinel used as the field separator in git log formatting.
 _LOG_SEP = "---CHANGELOG_SEP---"
 
+# Template for a single commit bullet in the rendered changelog.
+_COMMIT_LINE_TEMPLATE = "- {scope}{message}{refs} ({hash})"
+
+# Directory (relative to the repository root) holding memoized changelogs.
+_CACHE_DIR = Path(".cache") / "changelog"
+
+# Arguments that do not influence the generated markdown.
+_CACHE_IGNORED_ARGS = frozenset({"output", "summary", "no_cache"})
+
 
 # ---------------------------------------------------------------------------
-# Data classes
+# Data types
 # ---------------------------------------------------------------------------
 
-@dataclass
-class CommitInfo:
-    """Parsed representation of a single git commit."""
+class CommitInfo(NamedTuple):
+    """Parsed representation of a single git commit.
+
+    Instances are built once in ``classify_commit`` and never mutated, so
+    they are stored as compact immutable tuples.  PR and issue references
+    share one deduplicated ``refs`` tuple, since GitHub resolves both
+    through the same ``#NNN`` number.
+    """
 
     hash: str
     short_hash: str
@@ -103,8 +124,7 @@ class CommitInfo:
     category: str = "Other"
     scope: Optional[str] = None
     message: str = ""
-    pr_refs: list[str] = field(default_factory=list)
-    issue_refs: list[str] = field(default_factory=list)
+    refs: tuple[str, ...] = ()
     is_breaking: bool = False
 
 
@@ -184,30 +204,63 @@ def parse_github_base_url(remote_url: Optional[str]) -> Optional[str]:
     return None
 
 
-def fetch_commits(
+# Sentinel marking the end of one commit record in git log output.
+_RECORD_SEP = "---RECORD_END---"
+
+# Size of each read from the streamed ``git log`` output.
+_STREAM_CHUNK_SIZE = 1 << 16
+
+# Parsed git log record: hash, short hash, subject, body, author, date.
+RawCommit = tuple[str, str, str, str, str, str]
+
+
+def _parse_record(record: str) -> Optional[RawCommit]:
+    """Split one git log record into its stripped fields, or ``None``."""
+    record = record.strip()
+    if not record:
+        return None
+    parts = record.split(_LOG_SEP, 5)
+    if len(parts) < 6:
+        return None
+    return (
+        parts[0].strip(),
+        parts[1].strip(),
+        parts[2].strip(),
+        parts[3].strip(),
+        parts[4].strip(),
+        parts[5].strip(),
+    )
+
+
+def iter_commits(
     root: str,
     recent: int,
     since: Optional[str],
-) -> list[dict[str, str]]:
-    """Retrieve raw commit data from git log.
+) -> Iterator[RawCommit]:
+    """Stream raw commit records from git log.
+
+    Records are parsed as ``git log`` produces them, so callers can classify
+    each commit without the full history ever being held as a list.
 
     Args:
         root:   Repository root directory.
         recent: Maximum number of commits to retrieve.
         since:  Optional ISO date string to limit history.
 
-    Returns:
-        A list of dicts with keys ``hash``, ``short_hash``, ``subject``,
-        ``body``, ``author``, and ``date``.
+    Yields:
+        ``(hash, short_hash, subject, body, author, date)`` tuples.
+
+    Raises:
+        SystemExit: If ``git`` is missing or ``git log`` fails.
     """
     # Use a record-end sentinel so that multi-line commit bodies do not
     # break the field splitting.  The field separator (_LOG_SEP) delimits
-    # fields within a single commit, while record_sep marks the boundary
+    # fields within a single commit, while _RECORD_SEP marks the boundary
     # between commits.
-    record_sep = "---RECORD_END---"
-    fmt = _LOG_SEP.join(["%H", "%h", "%s", "%b", "%an", "%ai"]) + record_sep
+    fmt = _LOG_SEP.join(["%H", "%h", "%s", "%b", "%an", "%ai"]) + _RECORD_SEP
 
     cmd: list[str] = [
+        "git",
         "log",
         f"--pretty=format:{fmt}",
         f"-n{recent}",
@@ -215,54 +268,60 @@ def fetch_commits(
     if since:
         cmd.append(f"--since={since}")
 
-    result = _run_git(cmd, cwd=root)
-    if result.returncode != 0:
-        stderr = result.stderr.strip()
-        print(f"Error running git log: {stderr}", file=sys.stderr)
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=root,
+        )
+    except FileNotFoundError:
+        print("Error: git is not installed or not on PATH.", file=sys.stderr)
         sys.exit(1)
 
-    raw = result.stdout.strip()
-    if not raw:
-        return []
-
-    commits: list[dict[str, str]] = []
-    for record in raw.split(record_sep):
-        record = record.strip()
-        if not record:
-            continue
-        parts = record.split(_LOG_SEP, 5)
-        if len(parts) < 6:
-            continue
-
-        commits.append({
-            "hash": parts[0].strip(),
-            "short_hash": parts[1].strip(),
-            "subject": parts[2].strip(),
-            "body": parts[3].strip(),
-            "author": parts[4].strip(),
-            "date": parts[5].strip(),
-        })
+    with proc:
+        pending = ""
+        while chunk := proc.stdout.read(_STREAM_CHUNK_SIZE):
+            pending += chunk
+            *records, pending = pending.split(_RECORD_SEP)
+            for record in records:
+                parsed = _parse_record(record)
+                if parsed is not None:
+                    yield parsed
+        stderr = proc.stderr.read()
+
+    if proc.returncode != 0:
+        print(f"Error running git log: {stderr.strip()}", file=sys.stderr)
+        sys.exit(1)
 
-    return commits
+    parsed = _parse_record(pending)
+    if parsed is not None:
+        yield parsed
 
 
 # ---------------------------------------------------------------------------
 # Parsing helpers
 # ---------------------------------------------------------------------------
 
-def extract_references(text: str) -> list[str]:
-    """Return a deduplicated list of ``#NNN`` references found in *text*."""
-    return sorted(set(PR_ISSUE_RE.findall(text)))
+def extract_references(text: str) -> tuple[str, ...]:
+    """Return the sorted, deduplicated ``#NNN`` references found in *text*."""
+    return tuple(sorted(set(PR_ISSUE_RE.findall(text))))
 
 
-def classify_commit(raw: dict[str, str]) -> CommitInfo:
-    """Parse a raw commit dict into a structured ``CommitInfo``.
+def classify_commit(
+    hash: str,
+    short_hash: str,
+    subject: str,
+    body: str,
+    author: str,
+    date: str,
+) -> CommitInfo:
+    """Parse the fields of one git log record into a ``CommitInfo``.
 
     Applies conventional-commit parsing, reference extraction, and
     breaking-change detection.
     """
-    subject = raw["subject"]
-    body = raw.get("body", "")
     full_text = f"{subject}\n{body}"
 
     # Detect breaking change markers.
@@ -292,18 +351,17 @@ def classify_commit(raw: dict[str, str]) -> CommitInfo:
     refs = extract_references(full_text)
 
     return CommitInfo(
-        hash=raw["hash"],
-        short_hash=raw["short_hash"],
-        subject=subject,
-        body=body,
-        author=raw["author"],
-        date=raw["date"],
-        category=category,
-        scope=scope,
-        message=message,
-        pr_refs=refs,
-        issue_refs=refs,
-        is_breaking=is_breaking,
+        hash,
+        short_hash,
+        subject,
+        body,
+        author,
+        date,
+        category,
+        scope,
+        message,
+        refs,
+        is_breaking,
     )
 
 
@@ -312,10 +370,12 @@ def classify_commit(raw: dict[str, str]) -> CommitInfo:
 # ---------------------------------------------------------------------------
 
 def group_by_category(
-    commits: list[CommitInfo],
+    commits: Iterable[CommitInfo],
 ) -> dict[str, list[CommitInfo]]:
     """Group commits by their resolved category.
 
+    *commits* is consumed in a single pass, so it may be a lazy stream.
+
     Returns:
         An ordered dict following ``CATEGORY_ORDER`` (categories with no
         commits are omitted).
@@ -340,20 +400,23 @@ def group_by_category(
 # ---------------------------------------------------------------------------
 
 def _format_ref_links(
-    refs: list[str],
-    github_base: Optional[str],
+    refs: tuple[str, ...],
+    issue_prefix: Optional[str],
 ) -> str:
-    """Format PR/issue references as markdown links when possible."""
+    """Format PR/issue references as markdown links when possible.
+
+    Args:
+        refs:         Reference numbers without the leading ``#``.
+        issue_prefix: ``<github_base>/issues/`` or ``None`` for plain text.
+    """
     if not refs:
         return ""
 
-    parts: list[str] = []
-    for ref in refs:
-        if github_base:
-            # Link to the *issue* URL; GitHub redirects to PR if applicable.
-            parts.append(f"[#{ref}]({github_base}/issues/{ref})")
-        else:
-            parts.append(f"#{ref}")
+    if issue_prefix:
+        # Link to the *issue* URL; GitHub redirects to PR if applicable.
+        parts = [f"[#{ref}]({issue_prefix}{ref})" for ref in refs]
+    else:
+        parts = ["#" + ref for ref in refs]
 
     return " " + ", ".join(parts)
 
@@ -374,62 +437,81 @@ def generate_markdown(
         A complete Markdown document.
     """
     now_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    lines: list[str] = []
 
-    lines.append("# Changelog")
-    lines.append("")
-    lines.append("> Auto-generated from git commit history using conventional commits.")
-    lines.append(f"> Generated: {now_utc}")
-    lines.append("")
+    # Preallocate the line buffer instead of growing it append by append.
+    # Fixed header/summary/callout/footer lines (18), one summary row per
+    # category, and per section a heading, two blanks, and one line per
+    # commit.  This is an upper bound; the unused tail is trimmed below.
+    capacity = 18 + sum(len(items) + 4 for items in grouped.values())
+    lines: list[str] = [""] * capacity
+    used = 0
+
+    def emit(line: str) -> None:
+        nonlocal used
+        lines[used] = line
+        used += 1
+
+    emit("# Changelog")
+    emit("")
+    emit("> Auto-generated from git commit history using conventional commits.")
+    emit(f"> Generated: {now_utc}")
+    emit("")
 
     # Summary statistics table.
     category_counts = {cat: len(items) for cat, items in grouped.items()}
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("| Category | Count |")
-    lines.append("|----------|-------|")
+    emit("## Summary")
+    emit("")
+    emit("| Category | Count |")
+    emit("|----------|-------|")
     for cat in CATEGORY_ORDER:
         if cat in category_counts:
-            lines.append(f"| {cat} | {category_counts[cat]} |")
+            emit(f"| {cat} | {category_counts[cat]} |")
     # Any extra categories.
     for cat, count in category_counts.items():
-        if cat not in CATEGORY_ORDER:
-            lines.append(f"| {cat} | {count} |")
-    lines.append(f"| **Total** | **{total}** |")
-    lines.append("")
+        if cat not in _CATEGORY_ORDER_SET:
+            emit(f"| {cat} | {count} |")
+    emit(f"| **Total** | **{total}** |")
+    emit("")
 
     # Breaking changes get a prominent callout.
     if "Breaking Changes" in grouped:
-        lines.append("> **Warning**")
-        lines.append("> This changelog includes breaking changes. Review them carefully before upgrading.")
-        lines.append("")
-
-    # Category sections.
+        emit("> **Warning**")
+        emit("> This changelog includes breaking changes. Review them carefully before upgrading.")
+        emit("")
+
+    # Category sections.  The URL prefixes are built once rather than
+    # re-formatted for every commit and reference.
+    commit_prefix = f"{github_base}/commit/" if github_base else None
+    issue_prefix = f"{github_base}/issues/" if github_base else None
+    render_commit = _COMMIT_LINE_TEMPLATE.format_map
     for category, commits in grouped.items():
-        lines.append(f"## {category}")
-        lines.append("")
+        emit(f"## {category}")
+        emit("")
         for commit in commits:
             scope_prefix = f"**{commit.scope}:** " if commit.scope else ""
-            ref_links = _format_ref_links(commit.pr_refs, github_base)
+            ref_links = _format_ref_links(commit.refs, issue_prefix)
             short_hash = commit.short_hash
 
-            if github_base:
-                hash_link = f"[`{short_hash}`]({github_base}/commit/{commit.hash})"
+            if commit_prefix:
+                hash_link = "[`" + short_hash + "`](" + commit_prefix + commit.hash + ")"
             else:
                 hash_link = f"`{short_hash}`"
 
-            lines.append(
-                f"- {scope_prefix}{commit.message}{ref_links} ({hash_link})"
-            )
-        lines.append("")
+            emit(render_commit({
+                "scope": scope_prefix,
+                "message": commit.message,
+                "refs": ref_links,
+                "hash": hash_link,
+            }))
+        emit("")
 
     # Footer.
-    lines.append("---")
-    lines.append("")
-    lines.append(f"*{total} commits processed.*")
-    lines.append("")
+    emit("---")
+    emit("")
+    emit(f"*{total} commits processed.*")
+    emit("")
 
-    return "\n".join(lines)
+    return "\n".join(lines[:used])
 
 
 def generate_summary(grouped: dict[str, list[CommitInfo]], total: int) -> str:
@@ -442,19 +524,58 @@ def generate_summary(grouped: dict[str, list[CommitInfo]], total: int) -> str:
     Returns:
         A concise multi-line summary string.
     """
-    parts: list[str] = [
-        f"Changelog generated: {total} commits processed.",
-        "",
-    ]
+    # Exactly two header lines plus one line per category.
+    parts: list[str] = [""] * (2 + len(grouped))
+    parts[0] = f"Changelog generated: {total} commits processed."
+    i = 2
     for cat in CATEGORY_ORDER:
         if cat in grouped:
-            parts.append(f"  - {cat}: {len(grouped[cat])}")
+            parts[i] = f"  - {cat}: {len(grouped[cat])}"
+            i += 1
     for cat in sorted(grouped):
-        if cat not in CATEGORY_ORDER:
-            parts.append(f"  - {cat}: {len(grouped[cat])}")
+        if cat not in _CATEGORY_ORDER_SET:
+            parts[i] = f"  - {cat}: {len(grouped[cat])}"
+            i += 1
     return "\n".join(parts)
 
 
+# ---------------------------------------------------------------------------
+# Output writing and caching
+# ---------------------------------------------------------------------------
+
+def _cache_key(root: str, args: argparse.Namespace) -> Optional[str]:
+    """Return a cache key derived from ``HEAD`` and the content-affecting args.
+
+    Returns:
+        A short hex digest, or ``None`` if ``HEAD`` cannot be resolved
+        (e.g. a repository without commits).
+    """
+    result = _run_git(["rev-parse", "HEAD"], cwd=root)
+    if result.returncode != 0:
+        return None
+    head = result.stdout.strip()
+    relevant = sorted(
+        (k, v) for k, v in vars(args).items() if k not in _CACHE_IGNORED_ARGS
+    )
+    digest = hashlib.blake2b((head + repr(relevant)).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    """Write *content* to *path* as UTF-8 via a temp file and ``os.replace``.
+
+    The text is encoded once and written as raw bytes, and readers never
+    observe a partially written file.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(content.encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -496,6 +617,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print a short summary to stdout (for GITHUB_STEP_SUMMARY).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always regenerate, ignoring any changelog cached for this HEAD.",
+    )
     return parser.parse_args()
 
 
@@ -511,10 +637,27 @@ def main() -> int:
     # --- Validate environment -------------------------------------------
     verify_git_repo(root)
 
-    # --- Gather commit data ---------------------------------------------
-    raw_commits = fetch_commits(root, recent=args.recent, since=args.since)
+    # --- Reuse a cached changelog when HEAD and args are unchanged ------
+    cache_path: Optional[Path] = None
+    if args.output and not args.no_cache:
+        key = _cache_key(root, args)
+        if key is not None:
+            cache_path = Path(root) / _CACHE_DIR / f"{key}.md"
+    if cache_path is not None and not args.summary and cache_path.is_file():
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(output_path, cache_path.read_text(encoding="utf-8"))
+        print(f"Changelog written to {output_path} (cached)")
+        return 0
 
-    if not raw_commits:
+    # --- Gather, classify, and group commits in one pass ----------------
+    grouped = group_by_category(
+        classify_commit(*record)
+        for record in iter_commits(root, recent=args.recent, since=args.since)
+    )
+    total = sum(len(commits) for commits in grouped.values())
+
+    if not total:
         msg = "No commits found"
         if args.since:
             msg += f" since {args.since}"
@@ -525,18 +668,13 @@ def main() -> int:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             now_utc = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-            output_path.write_text(
+            _write_atomic(
+                output_path,
                 f"# Changelog\n\n> Generated: {now_utc}\n\nNo commits found.\n",
-                encoding="utf-8",
             )
             print(f"Wrote empty changelog to {output_path}")
         return 0
 
-    # --- Classify and group ---------------------------------------------
-    commits = [classify_commit(raw) for raw in raw_commits]
-    grouped = group_by_category(commits)
-    total = len(commits)
-
     # --- Resolve GitHub base URL for links ------------------------------
     remote_url = get_remote_url(root)
     github_base = parse_github_base_url(remote_url)
@@ -548,8 +686,11 @@ def main() -> int:
     if args.output:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(markdown, encoding="utf-8")
+        _write_atomic(output_path, markdown)
         print(f"Changelog written to {output_path}")
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(cache_path, markdown)
 
     # --- Summary mode ---------------------------------------------------
     if args.summary:
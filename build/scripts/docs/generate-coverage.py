@@ -10,6 +10,10 @@ the project documentation.
 Produces a Markdown report with per-category coverage tables,
 a list of undocumented items, and actionable recommendations.
 
+Per-file C# scan results are cached in ``.cache/doc-coverage.pkl`` and
+reused while a file's modification time and size are unchanged; pass
+``--no-cache`` to force a full rescan.
+
 Usage:
     python3 generate-coverage.py
     python3 generate-coverage.py --root /path/to/repo --output report.md
@@ -19,13 +23,19 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import os
+import pickle
 import re
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -43,41 +53,104 @@ EXCLUDE_DIRS: Set[str] = {
 
 CS_FILE_EXTENSIONS: Tuple[str, ...] = (".cs",)
 
+# Per-file source scan cache, relative to the repository root.
+SCAN_CACHE_PATH = Path(".cache") / "doc-coverage.pkl"
+
 DOC_FILE_EXTENSIONS: Tuple[str, ...] = (".md",)
 
+def _try_import_re2() -> Any:
+    """Attempt to import an RE2 binding (google-re2 / pyre2); return it or None."""
+    try:
+        import re2  # type: ignore[import-not-found]
+        return re2
+    except ImportError:
+        return None
+
+
+_RE2 = _try_import_re2()
+
+
+def _compile_scanner(pattern: str) -> Any:
+    """Compile a C# source-scanning pattern, preferring RE2 when installed.
+
+    RE2 matches in linear time without backtracking, which suits scanning
+    every byte of every source file.  The scanner patterns avoid
+    backreferences and lookarounds and carry their flags inline, so they
+    compile under both engines; ``re`` is used if RE2 is missing or rejects
+    a pattern.  Note RE2's ``\\w`` is ASCII-only.
+    """
+    if _RE2 is not None:
+        try:
+            return _RE2.compile(pattern)
+        except Exception:  # RE2 raises its own error type per binding
+            pass
+    return re.compile(pattern)
+
+
 # Regex: public (static )?(sealed )?(partial )?(class|interface|record|enum) Name
-PUBLIC_TYPE_RE = re.compile(
-    r"^\s*(?:\[.*?\]\s*)*"                          # optional attributes
+_PUBLIC_TYPE_PATTERN = (
+    r"\s*(?:\[.*?\]\s*)*"                           # optional attributes
     r"public\s+"
     r"(?:static\s+)?"
     r"(?:sealed\s+)?"
     r"(?:partial\s+)?"
     r"(?:abstract\s+)?"
     r"(class|interface|record|enum)\s+"
-    r"([A-Z]\w*)",                                   # type name
-    re.MULTILINE,
+    r"([A-Z]\w*)"                                    # type name
 )
+PUBLIC_TYPE_RE = _compile_scanner("(?m)^" + _PUBLIC_TYPE_PATTERN)
+
+# The same pattern anchored on the newline that ends the previous line.  A
+# literal first character lets the regex engine jump straight between line
+# starts instead of attempting a match at every offset; the file's first
+# line has no preceding newline and is tried with PUBLIC_TYPE_RE.match.
+_PUBLIC_TYPE_AFTER_NEWLINE_RE = _compile_scanner("\n" + _PUBLIC_TYPE_PATTERN)
 
 # Route-style endpoint patterns
-ROUTE_ATTRIBUTE_RE = re.compile(
+ROUTE_ATTRIBUTE_RE = _compile_scanner(
     r'\[\s*(?:Http(?:Get|Post|Put|Delete|Patch)|Route)\s*\(\s*"([^"]+)"\s*\)',
 )
-MAP_ENDPOINT_RE = re.compile(
+MAP_ENDPOINT_RE = _compile_scanner(
     r'\.(?:MapGet|MapPost|MapPut|MapDelete|MapPatch)\s*\(\s*"([^"]+)"',
 )
 
 # ADR reference in source: [ImplementsAdr("ADR-001", ...)]
-ADR_REF_RE = re.compile(r'ImplementsAdr\s*\(\s*"(ADR-\d+)"')
+ADR_REF_RE = _compile_scanner(r'ImplementsAdr\s*\(\s*"(ADR-\d+)"')
 
 # ADR file naming: 001-provider-abstraction.md -> ADR-001
 ADR_FILE_RE = re.compile(r"^(\d{3})-.*\.md$")
 
+# Numeric part of an ADR identifier, ignoring zero padding: ADR-001 -> 1
+ADR_NUM_RE = re.compile(r"ADR-0*(\d+)")
+
+# A JSON string literal (group 1, kept) or a // line comment (dropped).
+JSON_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\\n])*")|//[^\n]*')
+
+# Parameter segment of a route template: /api/jobs/{id} -> /api/jobs
+ROUTE_PARAM_RE = re.compile(r"/\{[^}]+\}")
+
+# Documentation consulted by the per-category checks, keyed like the
+# ``_load_reference_docs`` result (paths relative to the repository root).
+CLAUDE_MD_KEY = str(Path("CLAUDE.md"))
+API_REFERENCE_KEY = str(Path("docs", "reference", "api-reference.md"))
+CONFIG_SCHEMA_KEY = str(Path("docs", "generated", "configuration-schema.md"))
+PROVIDER_DOCS_DIR = Path("docs", "providers")
+
+# Identifier-like words in documentation, used to index type-name mentions.
+TOKEN_RE = re.compile(r"[A-Za-z_]\w*")
+
+# Characters read per step when streaming documentation for the token index.
+DOC_CHUNK_SIZE = 64 * 1024
+
+# Threads used to overlap documentation file reads; reads release the GIL.
+IO_WORKERS = 32
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SourceItem:
     """A source-level construct that may or may not be documented."""
 
@@ -87,7 +160,7 @@ class SourceItem:
     documented: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryResult:
     """Coverage result for a single category."""
 
@@ -95,10 +168,17 @@ class CategoryResult:
     total: int = 0
     documented: int = 0
     items: List[SourceItem] = field(default_factory=list)
+    # Memo for ``undocumented_items``; filled by ``_category_result``,
+    # otherwise computed on first access.
+    _undocumented: Optional[List[SourceItem]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def undocumented_items(self) -> List[SourceItem]:
-        return [item for item in self.items if not item.documented]
+        if self._undocumented is None:
+            self._undocumented = [item for item in self.items if not item.documented]
+        return self._undocumented
 
     @property
     def coverage_pct(self) -> float:
@@ -107,7 +187,7 @@ class CategoryResult:
         return (self.documented / self.total) * 100.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageReport:
     """Full documentation coverage report."""
 
@@ -133,22 +213,22 @@ class CoverageReport:
 # Utility helpers
 # ---------------------------------------------------------------------------
 
-def _should_skip(path: Path) -> bool:
-    """Return True if *path* is inside an excluded directory."""
-    for part in path.parts:
-        if part in EXCLUDE_DIRS:
-            return True
-    return False
-
+@lru_cache(maxsize=None)
+def _collect_files(root: Path, extensions: Tuple[str, ...]) -> Tuple[Path, ...]:
+    """Recursively collect files matching *extensions*, honouring exclusions.
 
-def _collect_files(root: Path, extensions: Tuple[str, ...]) -> List[Path]:
-    """Recursively collect files matching *extensions*, honouring exclusions."""
+    A single ``os.walk`` covers every extension, and excluded directories
+    are pruned before they are descended into.  Results are cached per
+    ``(root, extensions)`` for the lifetime of the process.
+    """
     results: List[Path] = []
-    for ext in extensions:
-        for p in root.rglob(f"*{ext}"):
-            if not _should_skip(p):
-                results.append(p)
-    return results
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        base = Path(dirpath)
+        results.extend(
+            base / name for name in filenames if name.endswith(extensions)
+        )
+    return tuple(results)
 
 
 def _read_text_safe(path: Path) -> str:
@@ -159,6 +239,52 @@ def _read_text_safe(path: Path) -> str:
         return ""
 
 
+def _read_many(paths: Iterable[Path]) -> Dict[Path, str]:
+    """Read *paths* concurrently with ``_read_text_safe``, keyed by path."""
+    paths = list(paths)
+    if len(paths) < 2:
+        return {path: _read_text_safe(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=min(IO_WORKERS, len(paths))) as pool:
+        return dict(zip(paths, pool.map(_read_text_safe, paths)))
+
+
+def _try_import_ahocorasick() -> Any:
+    """Attempt to import pyahocorasick; return the module or None."""
+    try:
+        import ahocorasick  # type: ignore[import-not-found]
+        return ahocorasick
+    except ImportError:
+        return None
+
+
+_AHOCORASICK = _try_import_ahocorasick()
+
+
+def _find_mentions(patterns: Iterable[str], text: str) -> Set[str]:
+    """Return the subset of *patterns* that occur as substrings of *text*.
+
+    Uses a single Aho-Corasick pass over *text* when pyahocorasick is
+    installed, falling back to one ``in`` scan per pattern otherwise.
+    """
+    unique = set(patterns)
+    # The empty string trivially occurs in any text.
+    found: Set[str] = {p for p in unique if not p}
+    unique -= found
+    if not unique:
+        return found
+
+    if _AHOCORASICK is None:
+        found.update(p for p in unique if p in text)
+        return found
+
+    automaton = _AHOCORASICK.Automaton()
+    for pattern in unique:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    found.update(pattern for _end, pattern in automaton.iter(text))
+    return found
+
+
 def _rel(path: Path, root: Path) -> str:
     """Return a portable relative path string."""
     try:
@@ -167,122 +293,265 @@ def _rel(path: Path, root: Path) -> str:
         return str(path)
 
 
+def _category_result(category: str, items: List[SourceItem]) -> CategoryResult:
+    """Assemble a ``CategoryResult`` from items whose ``documented`` flag is set.
+
+    The undocumented items are partitioned out in the same pass that yields
+    the documented count, so reports never re-scan the item list.
+    """
+    undocumented = [item for item in items if not item.documented]
+    result = CategoryResult(
+        category=category,
+        total=len(items),
+        documented=len(items) - len(undocumented),
+        items=items,
+    )
+    result._undocumented = undocumented
+    return result
+
+
 # ---------------------------------------------------------------------------
-# Analysis: Public types
+# Analysis: C# source scan
 # ---------------------------------------------------------------------------
 
-def _scan_public_types(root: Path) -> List[SourceItem]:
-    """Scan C# source files for public class / interface / record / enum."""
-    src_dir = root / "src"
-    if not src_dir.is_dir():
-        return []
-
-    items: List[SourceItem] = []
-    seen: Set[str] = set()
+# (name, line) matches for one file: public types, endpoints, ADR references.
+FileMatches = Tuple[
+    List[Tuple[str, int]],
+    List[Tuple[str, int]],
+    List[Tuple[str, int]],
+]
+
+# Persisted scan result for one file: (st_mtime_ns, st_size, matches).
+ScanCacheEntry = Tuple[int, int, FileMatches]
+
+
+def _scan_cs_file(cs_file: Path) -> FileMatches:
+    """Run every source regex over one C# file.
+
+    The route, endpoint-mapping, and ADR patterns each open with a literal
+    the regex engine searches for quickly, so they stay as separate passes;
+    only the public-type pattern needs help to skip non-line-start offsets.
+
+    Executed in worker processes, so it only returns plain tuples.
+    """
+    text = _read_text_safe(cs_file)
+
+    def find(
+        pattern: Any,
+        group: int,
+        pos: int = 0,
+        first_line: int = 1,
+    ) -> List[Tuple[str, int]]:
+        # Matches arrive in ascending order, so only the newlines between
+        # consecutive matches are counted: O(len(text)) per pass instead of
+        # re-counting the whole prefix for every match.
+        found: List[Tuple[str, int]] = []
+        line = first_line
+        last = pos
+        for match in pattern.finditer(text, pos):
+            start = match.start()
+            line += text.count("\n", last, start)
+            last = start
+            found.append((match.group(group), line))
+        return found
+
+    types: List[Tuple[str, int]] = []
+    pos = 0
+    first = PUBLIC_TYPE_RE.match(text)
+    if first:
+        types.append((first.group(2), 1))
+        pos = first.end()
+    # Each match starts on the newline before the declaration's line, hence
+    # the extra line in the starting count.
+    types.extend(
+        find(_PUBLIC_TYPE_AFTER_NEWLINE_RE, 2, pos, text.count("\n", 0, pos) + 2)
+    )
 
-    for cs_file in _collect_files(src_dir, CS_FILE_EXTENSIONS):
-        text = _read_text_safe(cs_file)
-        for match in PUBLIC_TYPE_RE.finditer(text):
-            type_name = match.group(2)
-            if type_name in seen:
-                continue
-            seen.add(type_name)
-            line_num = text[:match.start()].count("\n") + 1
-            items.append(
-                SourceItem(
-                    name=type_name,
-                    file_path=_rel(cs_file, root),
-                    line=line_num,
-                )
-            )
-    return items
+    return (
+        types,
+        find(ROUTE_ATTRIBUTE_RE, 1) + find(MAP_ENDPOINT_RE, 1),
+        find(ADR_REF_RE, 1),
+    )
 
 
-def _check_type_documentation(
-    items: List[SourceItem],
-    doc_contents: Dict[str, str],
-) -> CategoryResult:
-    """Mark items as documented if any doc file mentions their name."""
-    for item in items:
-        for _doc_path, content in doc_contents.items():
-            if item.name in content:
-                item.documented = True
-                break
-
-    documented = sum(1 for i in items if i.documented)
-    return CategoryResult(
-        category="Public Classes / Interfaces",
-        total=len(items),
-        documented=documented,
-        items=items,
+def _scan_fingerprint() -> str:
+    """Digest of the source patterns; a change invalidates cached matches."""
+    patterns = (
+        PUBLIC_TYPE_RE,
+        _PUBLIC_TYPE_AFTER_NEWLINE_RE,
+        ROUTE_ATTRIBUTE_RE,
+        MAP_ENDPOINT_RE,
+        ADR_REF_RE,
     )
+    joined = "\0".join(p.pattern for p in patterns)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
 
 
-# ---------------------------------------------------------------------------
-# Analysis: API endpoints
-# ---------------------------------------------------------------------------
+def _load_scan_cache(cache_path: Path) -> Dict[str, ScanCacheEntry]:
+    """Load cached per-file matches, or an empty cache if unusable."""
+    try:
+        with cache_path.open("rb") as handle:
+            fingerprint, entries = pickle.load(handle)
+    except Exception:  # missing, truncated, or from an incompatible version
+        return {}
+    if fingerprint != _scan_fingerprint() or not isinstance(entries, dict):
+        return {}
+    return entries
+
+
+def _save_scan_cache(cache_path: Path, entries: Dict[str, ScanCacheEntry]) -> None:
+    """Persist per-file matches atomically; failures only cost a rescan."""
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("wb") as handle:
+            pickle.dump((_scan_fingerprint(), entries), handle, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
-def _scan_endpoints(root: Path) -> List[SourceItem]:
-    """Scan source for HTTP API route definitions."""
-    src_dir = root / "src"
-    if not src_dir.is_dir():
-        return []
 
-    items: List[SourceItem] = []
-    seen: Set[str] = set()
+def _scan_sources(
+    root: Path,
+    cache_path: Optional[Path] = None,
+) -> Tuple[List[SourceItem], List[SourceItem], List[SourceItem]]:
+    """Scan C# sources for public types, HTTP routes, and ADR references.
 
-    for cs_file in _collect_files(src_dir, CS_FILE_EXTENSIONS):
-        text = _read_text_safe(cs_file)
+    Every file under ``src/`` is read once and scanned in a process pool;
+    the per-file matches are merged here, keeping the first occurrence of
+    each name in file order.
 
-        for pattern in (ROUTE_ATTRIBUTE_RE, MAP_ENDPOINT_RE):
-            for match in pattern.finditer(text):
-                route = match.group(1)
-                if route in seen:
+    When *cache_path* is given, matches are persisted there keyed by each
+    file's ``(st_mtime_ns, st_size)``, and unchanged files are not rescanned.
+
+    Returns:
+        ``(type_items, endpoint_items, adr_items)``.
+    """
+    src_dir = root / "src"
+    if not src_dir.is_dir():
+        return [], [], []
+
+    cs_files = _collect_files(src_dir, CS_FILE_EXTENSIONS)
+    # Relative paths double as cache keys and item locations; compute each once.
+    rel_paths = [_rel(cs_file, root) for cs_file in cs_files]
+    cached = _load_scan_cache(cache_path) if cache_path is not None else {}
+    fresh: Dict[str, ScanCacheEntry] = {}
+    file_results: List[Optional[FileMatches]] = [None] * len(cs_files)
+    stale: List[int] = []
+
+    for idx, (cs_file, key) in enumerate(zip(cs_files, rel_paths)):
+        try:
+            stat = cs_file.stat()
+        except OSError:
+            stale.append(idx)
+            continue
+        entry = cached.get(key)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            file_results[idx] = entry[2]
+            fresh[key] = entry
+        else:
+            stale.append(idx)
+            fresh[key] = (stat.st_mtime_ns, stat.st_size, ())
+
+    if stale:
+        with ProcessPoolExecutor() as executor:
+            scanned = executor.map(
+                _scan_cs_file, [cs_files[idx] for idx in stale], chunksize=16
+            )
+            for idx, file_matches in zip(stale, scanned):
+                file_results[idx] = file_matches
+                key = rel_paths[idx]
+                if key in fresh:
+                    fresh[key] = fresh[key][:2] + (file_matches,)
+
+    if cache_path is not None and (stale or len(fresh) != len(cached)):
+        _save_scan_cache(cache_path, fresh)
+
+    type_items: List[SourceItem] = []
+    endpoint_items: List[SourceItem] = []
+    adr_items: List[SourceItem] = []
+    seen: Tuple[Set[str], Set[str], Set[str]] = (set(), set(), set())
+
+    for rel_path, file_matches in zip(rel_paths, file_results):
+        for items, seen_names, matches in zip(
+            (type_items, endpoint_items, adr_items), seen, file_matches
+        ):
+            for name, line_num in matches:
+                if name in seen_names:
                     continue
-                seen.add(route)
-                line_num = text[:match.start()].count("\n") + 1
+                seen_names.add(name)
                 items.append(
                     SourceItem(
-                        name=route,
-                        file_path=_rel(cs_file, root),
+                        name=name,
+                        file_path=rel_path,
                         line=line_num,
                     )
                 )
-    return items
+
+    return type_items, endpoint_items, adr_items
 
 
+# ---------------------------------------------------------------------------
+# Analysis: Public types
+# ---------------------------------------------------------------------------
+
+def _check_type_documentation(
+    items: List[SourceItem],
+    doc_tokens: Set[str],
+) -> CategoryResult:
+    """Mark items as documented if any doc file mentions their name.
+
+    *doc_tokens* is the identifier index built by ``_build_doc_token_index``,
+    so each check is a single hash lookup rather than a scan of every doc.
+    """
+    for item in items:
+        item.documented = item.name in doc_tokens
+
+    return _category_result("Public Classes / Interfaces", items)
+
+
+# ---------------------------------------------------------------------------
+# Analysis: API endpoints
+# ---------------------------------------------------------------------------
+
 def _check_endpoint_documentation(
     items: List[SourceItem],
-    root: Path,
+    doc_contents: Dict[str, str],
 ) -> CategoryResult:
     """Check endpoints against docs/reference/api-reference.md and CLAUDE.md."""
-    api_ref = root / "docs" / "reference" / "api-reference.md"
-    claude_md = root / "CLAUDE.md"
-
-    combined_text = ""
-    for doc_path in (api_ref, claude_md):
-        combined_text += _read_text_safe(doc_path) + "\n"
+    combined_text = "\n".join(
+        doc_contents.get(doc_key, "")
+        for doc_key in (API_REFERENCE_KEY, CLAUDE_MD_KEY)
+    )
 
+    # Candidate spellings per route: the route without its leading slash,
+    # and the non-parameterised base path (/api/backfill/schedules/{id} ->
+    # /api/backfill/schedules) with and without the slash.
+    candidates: List[Tuple[SourceItem, str, str]] = []
     for item in items:
         # Normalise route for matching (strip leading /)
         route = item.name.lstrip("/")
+        # Strip parameter segments to get the base path
+        base = ROUTE_PARAM_RE.sub("", item.name)
+        candidates.append((item, route, base))
+
+    mentioned = _find_mentions(
+        (
+            text
+            for _item, route, base in candidates
+            for text in (route, base, base.lstrip("/"))
+        ),
+        combined_text,
+    )
+
+    for item, route, base in candidates:
         # Check if the route (or its non-parameterised prefix) appears in docs
-        if route in combined_text or f"/{route}" in combined_text:
+        if route in mentioned:
             item.documented = True
-        else:
-            # Try matching parameterised routes: /api/backfill/schedules/{id}
-            # Strip parameter segments and try the base path
-            base = re.sub(r"/\{[^}]+\}", "", item.name)
-            if base and (base in combined_text or base.lstrip("/") in combined_text):
-                item.documented = True
-
-    documented = sum(1 for i in items if i.documented)
-    return CategoryResult(
-        category="API Endpoints",
-        total=len(items),
-        documented=documented,
-        items=items,
-    )
+        elif base and (base in mentioned or base.lstrip("/") in mentioned):
+            item.documented = True
+
+    return _category_result("API Endpoints", items)
 
 
 # ---------------------------------------------------------------------------
@@ -303,27 +572,37 @@ def _flatten_json_keys(obj: object, prefix: str = "") -> List[str]:
     return keys
 
 
+def _try_import_orjson() -> Any:
+    """Attempt to import orjson; return the module or None."""
+    try:
+        import orjson  # type: ignore[import-not-found]
+        return orjson
+    except ImportError:
+        return None
+
+
+_ORJSON = _try_import_orjson()
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON *text* with orjson when installed, else the stdlib parser.
+
+    Raises:
+        ValueError: If *text* is not valid JSON (both parsers' decode errors
+            subclass it).
+    """
+    if _ORJSON is not None:
+        return _ORJSON.loads(text.encode("utf-8"))
+    return json.loads(text)
+
+
 def _strip_json_comments(text: str) -> str:
-    """Remove single-line // comments from JSON-with-comments text."""
-    lines: List[str] = []
-    in_string = False
-    for line in text.split("\n"):
-        cleaned: List[str] = []
-        i = 0
-        while i < len(line):
-            ch = line[i]
-            if ch == '"' and (i == 0 or line[i - 1] != "\\"):
-                in_string = not in_string
-                cleaned.append(ch)
-            elif not in_string and ch == "/" and i + 1 < len(line) and line[i + 1] == "/":
-                break  # rest of line is comment
-            else:
-                cleaned.append(ch)
-            i += 1
-        lines.append("".join(cleaned))
-        # Reset in_string at end of each line (single-line strings only)
-        in_string = False
-    return "\n".join(lines)
+    """Remove single-line // comments from JSON-with-comments text.
+
+    String literals are matched first and kept verbatim, so ``//`` inside a
+    value (e.g. a URL) survives; strings do not span lines.
+    """
+    return JSON_COMMENT_RE.sub(lambda m: m.group(1) or "", text)
 
 
 def _scan_config_keys(root: Path) -> List[SourceItem]:
@@ -333,10 +612,11 @@ def _scan_config_keys(root: Path) -> List[SourceItem]:
         return []
 
     raw = _read_text_safe(sample)
-    stripped = _strip_json_comments(raw)
+    # Only JSON-with-comments needs the stripping pass.
+    text = _strip_json_comments(raw) if "//" in raw else raw
     try:
-        data = json.loads(stripped)
-    except json.JSONDecodeError:
+        data = _json_loads(text)
+    except ValueError:
         return []
 
     # We care about top-level keys and one level of nesting.
@@ -344,46 +624,40 @@ def _scan_config_keys(root: Path) -> List[SourceItem]:
     if not isinstance(data, dict):
         return items
 
+    rel_path = _rel(sample, root)
     for key, value in data.items():
-        items.append(
-            SourceItem(name=key, file_path=_rel(sample, root))
-        )
+        items.append(SourceItem(name=key, file_path=rel_path))
         if isinstance(value, dict):
-            for sub_key in value:
-                items.append(
-                    SourceItem(
-                        name=f"{key}.{sub_key}",
-                        file_path=_rel(sample, root),
-                    )
+            items.extend(
+                SourceItem(
+                    name=f"{key}.{sub_key}",
+                    file_path=rel_path,
                 )
+                for sub_key in value
+            )
     return items
 
 
 def _check_config_documentation(
     items: List[SourceItem],
-    root: Path,
+    doc_contents: Dict[str, str],
 ) -> CategoryResult:
     """Check config keys against configuration-schema.md and CLAUDE.md."""
-    schema_doc = root / "docs" / "generated" / "configuration-schema.md"
-    claude_md = root / "CLAUDE.md"
-
-    combined = ""
-    for doc_path in (schema_doc, claude_md):
-        combined += _read_text_safe(doc_path) + "\n"
+    combined = "\n".join(
+        doc_contents.get(doc_key, "")
+        for doc_key in (CONFIG_SCHEMA_KEY, CLAUDE_MD_KEY)
+    )
 
-    for item in items:
-        # Match the key name or the dotted path
-        key_leaf = item.name.split(".")[-1]
-        if key_leaf in combined or item.name in combined:
+    # Match the key name or the dotted path
+    leaves = [item.name.split(".")[-1] for item in items]
+    mentioned = _find_mentions(
+        [*leaves, *(item.name for item in items)], combined
+    )
+    for item, key_leaf in zip(items, leaves):
+        if key_leaf in mentioned or item.name in mentioned:
             item.documented = True
 
-    documented = sum(1 for i in items if i.documented)
-    return CategoryResult(
-        category="Configuration Options",
-        total=len(items),
-        documented=documented,
-        items=items,
-    )
+    return _category_result("Configuration Options", items)
 
 
 # ---------------------------------------------------------------------------
@@ -423,138 +697,162 @@ def _scan_providers(root: Path) -> List[SourceItem]:
 
 def _check_provider_documentation(
     items: List[SourceItem],
-    root: Path,
+    doc_contents: Dict[str, str],
 ) -> CategoryResult:
     """Check if providers are mentioned in docs/providers/ or CLAUDE.md."""
-    provider_docs_dir = root / "docs" / "providers"
-    claude_md = root / "CLAUDE.md"
-
-    combined = _read_text_safe(claude_md)
-    if provider_docs_dir.is_dir():
-        for md_file in provider_docs_dir.glob("*.md"):
-            combined += "\n" + _read_text_safe(md_file)
-
-    for item in items:
-        # Extract short provider name (e.g. "Alpaca" from "Streaming/Alpaca")
-        provider_name = item.name.split("/")[-1]
-        if provider_name.lower() in combined.lower():
+    combined = "\n".join([
+        doc_contents.get(CLAUDE_MD_KEY, ""),
+        *(
+            content
+            for doc_key, content in doc_contents.items()
+            if Path(doc_key).parent == PROVIDER_DOCS_DIR
+        ),
+    ])
+
+    # Matching is case-insensitive: lowercase the corpus and each short
+    # provider name (e.g. "alpaca" from "Streaming/Alpaca") exactly once.
+    combined_lc = combined.lower()
+    names_lc = [item.name.split("/")[-1].lower() for item in items]
+    mentioned = _find_mentions(names_lc, combined_lc)
+    for item, name_lc in zip(items, names_lc):
+        if name_lc in mentioned:
             item.documented = True
 
-    documented = sum(1 for i in items if i.documented)
-    return CategoryResult(
-        category="Provider Implementations",
-        total=len(items),
-        documented=documented,
-        items=items,
-    )
+    return _category_result("Provider Implementations", items)
 
 
 # ---------------------------------------------------------------------------
 # Analysis: ADR implementations
 # ---------------------------------------------------------------------------
 
-def _scan_adr_references(root: Path) -> List[SourceItem]:
-    """Find ADR identifiers referenced in source via [ImplementsAdr]."""
-    src_dir = root / "src"
-    if not src_dir.is_dir():
-        return []
-
-    seen: Set[str] = set()
-    items: List[SourceItem] = []
-
-    for cs_file in _collect_files(src_dir, CS_FILE_EXTENSIONS):
-        text = _read_text_safe(cs_file)
-        for match in ADR_REF_RE.finditer(text):
-            adr_id = match.group(1)  # e.g. "ADR-001"
-            if adr_id in seen:
-                continue
-            seen.add(adr_id)
-            line_num = text[:match.start()].count("\n") + 1
-            items.append(
-                SourceItem(
-                    name=adr_id,
-                    file_path=_rel(cs_file, root),
-                    line=line_num,
-                )
-            )
-    return items
-
-
 def _check_adr_documentation(
     items: List[SourceItem],
     root: Path,
 ) -> CategoryResult:
     """Check that each referenced ADR has a matching file in docs/adr/."""
     adr_dir = root / "docs" / "adr"
-    existing_adrs: Set[str] = set()
+    # ADRs are compared by numeric id, so ADR-1 and ADR-001 match without
+    # normalising either side to a padded string.
+    existing_ids: Set[int] = set()
 
     if adr_dir.is_dir():
         for f in adr_dir.iterdir():
             m = ADR_FILE_RE.match(f.name)
             if m:
-                num = int(m.group(1))
-                existing_adrs.add(f"ADR-{num:03d}")
+                existing_ids.add(int(m.group(1)))
 
     for item in items:
-        # Normalise to 3-digit form: ADR-1 -> ADR-001
-        num_match = re.search(r"ADR-0*(\d+)", item.name)
+        num_match = ADR_NUM_RE.search(item.name)
         if num_match:
-            normalised = f"ADR-{int(num_match.group(1)):03d}"
-            item.documented = normalised in existing_adrs
+            item.documented = int(num_match.group(1)) in existing_ids
 
-    documented = sum(1 for i in items if i.documented)
-    return CategoryResult(
-        category="ADR Implementations",
-        total=len(items),
-        documented=documented,
-        items=items,
-    )
+    return _category_result("ADR Implementations", items)
 
 
 # ---------------------------------------------------------------------------
 # Documentation content loader
 # ---------------------------------------------------------------------------
 
-def _load_doc_contents(root: Path) -> Dict[str, str]:
-    """Load all Markdown documentation content keyed by relative path."""
+def _doc_files(root: Path) -> List[Path]:
+    """Return every Markdown file under docs/ plus the root CLAUDE.md and README.md."""
     docs_dir = root / "docs"
-    contents: Dict[str, str] = {}
+    paths: List[Path] = []
     if docs_dir.is_dir():
-        for md_file in _collect_files(docs_dir, DOC_FILE_EXTENSIONS):
-            contents[_rel(md_file, root)] = _read_text_safe(md_file)
-    # Also include CLAUDE.md at repo root
-    claude_md = root / "CLAUDE.md"
-    if claude_md.is_file():
-        contents[_rel(claude_md, root)] = _read_text_safe(claude_md)
-    # And README.md
-    readme = root / "README.md"
-    if readme.is_file():
-        contents[_rel(readme, root)] = _read_text_safe(readme)
-    return contents
+        paths.extend(_collect_files(docs_dir, DOC_FILE_EXTENSIONS))
+    for name in ("CLAUDE.md", "README.md"):
+        candidate = root / name
+        if candidate.is_file():
+            paths.append(candidate)
+    return paths
+
+
+def _iter_file_chunks(path: Path) -> Iterator[str]:
+    """Yield the text of *path* in pieces of at most ``DOC_CHUNK_SIZE`` characters."""
+    try:
+        with path.open(encoding="utf-8", errors="replace") as handle:
+            while chunk := handle.read(DOC_CHUNK_SIZE):
+                yield chunk
+    except OSError:
+        return
+
+
+def _tokenize_doc(path: Path) -> Set[str]:
+    """Return the identifier-like words in one doc file.
+
+    The file is streamed chunk by chunk so it is never held in memory at
+    once.  A word run touching the end of a chunk is carried into the next
+    one so identifiers are never split across a chunk boundary.
+    """
+    tokens: Set[str] = set()
+    carry = ""
+    for chunk in _iter_file_chunks(path):
+        text = carry + chunk
+        cut = len(text)
+        while cut and (text[cut - 1].isalnum() or text[cut - 1] == "_"):
+            cut -= 1
+        carry = text[cut:]
+        tokens.update(TOKEN_RE.findall(text, 0, cut))
+    tokens.update(TOKEN_RE.findall(carry))
+    return tokens
+
+
+def _build_doc_token_index(root: Path) -> Set[str]:
+    """Return the set of identifier-like words appearing in any doc file.
+
+    Files are tokenized on a thread pool so their reads overlap; the
+    per-file token sets are merged as they complete.
+    """
+    tokens: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+        for file_tokens in pool.map(_tokenize_doc, _doc_files(root)):
+            tokens |= file_tokens
+    return tokens
+
+
+def _load_reference_docs(root: Path) -> Dict[str, str]:
+    """Load the docs searched by the endpoint, config, and provider checks.
+
+    Only this handful of files is held in memory, keyed by path relative
+    to *root*, and shared between the checks so each is read once.  The
+    files are read concurrently.
+    """
+    paths = [
+        root / key
+        for key in (CLAUDE_MD_KEY, API_REFERENCE_KEY, CONFIG_SCHEMA_KEY)
+    ]
+    provider_docs_dir = root / PROVIDER_DOCS_DIR
+    if provider_docs_dir.is_dir():
+        paths.extend(provider_docs_dir.glob("*.md"))
+    contents = _read_many(path for path in paths if path.is_file())
+    return {_rel(path, root): text for path, text in contents.items()}
 
 
 # ---------------------------------------------------------------------------
 # Report generation
 # ---------------------------------------------------------------------------
 
-def _coverage_bar(pct: float, width: int = 20) -> str:
+# Progress bars for the default width, indexed by filled cell count.
+_BAR_WIDTH = 20
+_BAR_TABLE: Tuple[str, ...] = tuple(
+    "=" * filled + "-" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1)
+)
+
+# Lower bounds of grades D, C, B, A; anything below the first is an F.
+_GRADE_THRESHOLDS: Tuple[float, ...] = (40, 60, 75, 90)
+_GRADES = "FDCBA"
+
+
+def _coverage_bar(pct: float, width: int = _BAR_WIDTH) -> str:
     """Render a text-based progress bar for Markdown."""
-    filled = round(pct / 100 * width)
-    empty = width - filled
-    return f"{'=' * filled}{'-' * empty}"
+    filled = min(max(round(pct / 100 * width), 0), width)
+    if width == _BAR_WIDTH:
+        return _BAR_TABLE[filled]
+    return f"{'=' * filled}{'-' * (width - filled)}"
 
 
 def _grade(pct: float) -> str:
     """Letter grade for a coverage percentage."""
-    if pct >= 90:
-        return "A"
-    if pct >= 75:
-        return "B"
-    if pct >= 60:
-        return "C"
-    if pct >= 40:
-        return "D"
-    return "F"
+    return _GRADES[bisect_right(_GRADE_THRESHOLDS, pct)]
 
 
 def _recommendations(report: CoverageReport) -> List[str]:  # noqa: C901
@@ -622,152 +920,161 @@ def _recommendations(report: CoverageReport) -> List[str]:  # noqa: C901
     return recs
 
 
-def generate_markdown(report: CoverageReport) -> str:
-    """Render the full Markdown coverage report."""
-    lines: List[str] = []
-
-    lines.append("# Documentation Coverage Report")
-    lines.append("")
-    lines.append("> Auto-generated by `build/scripts/docs/generate-coverage.py`")
-    lines.append(f"> Generated: {report.generated_at}")
-    lines.append("")
+def _render_markdown(report: CoverageReport) -> Iterator[str]:
+    """Yield the lines of the full Markdown coverage report."""
+    yield "# Documentation Coverage Report"
+    yield ""
+    yield "> Auto-generated by `build/scripts/docs/generate-coverage.py`"
+    yield f"> Generated: {report.generated_at}"
+    yield ""
 
     # --- Overall ---
-    lines.append("## Overall Coverage")
-    lines.append("")
+    yield "## Overall Coverage"
+    yield ""
     grade = _grade(report.overall_pct)
-    lines.append(
+    yield (
         f"**{report.overall_documented} / {report.overall_total}** items documented "
         f"(**{report.overall_pct:.1f}%**) &mdash; Grade: **{grade}**"
     )
-    lines.append("")
-    lines.append("```")
-    lines.append(f"[{_coverage_bar(report.overall_pct)}] {report.overall_pct:.1f}%")
-    lines.append("```")
-    lines.append("")
+    yield ""
+    yield "```"
+    yield f"[{_coverage_bar(report.overall_pct)}] {report.overall_pct:.1f}%"
+    yield "```"
+    yield ""
 
     # --- Per-category table ---
-    lines.append("## Coverage by Category")
-    lines.append("")
-    lines.append("| Category | Documented | Total | Coverage | Grade |")
-    lines.append("|----------|-----------|-------|----------|-------|")
+    yield "## Coverage by Category"
+    yield ""
+    yield "| Category | Documented | Total | Coverage | Grade |"
+    yield "|----------|-----------|-------|----------|-------|"
     for cat in report.categories:
-        lines.append(
+        yield (
             f"| {cat.category} | {cat.documented} | {cat.total} "
             f"| {cat.coverage_pct:.1f}% | {_grade(cat.coverage_pct)} |"
         )
-    lines.append("")
+    yield ""
 
     # --- Undocumented items ---
     has_undocumented = any(cat.undocumented_items for cat in report.categories)
     if has_undocumented:
-        lines.append("## Undocumented Items")
-        lines.append("")
+        yield "## Undocumented Items"
+        yield ""
 
         for cat in report.categories:
             undoc = cat.undocumented_items
             if not undoc:
                 continue
-            lines.append(f"### {cat.category} ({len(undoc)} undocumented)")
-            lines.append("")
-            lines.append("| Item | Location |")
-            lines.append("|------|----------|")
+            yield f"### {cat.category} ({len(undoc)} undocumented)"
+            yield ""
+            yield "| Item | Location |"
+            yield "|------|----------|"
             # Show up to 50 items per category to keep the report manageable
             display = undoc[:50]
             for item in display:
                 loc = item.file_path
                 if item.line:
                     loc += f":{item.line}"
-                lines.append(f"| `{item.name}` | `{loc}` |")
+                yield f"| `{item.name}` | `{loc}` |"
             if len(undoc) > 50:
-                lines.append(
-                    f"| ... and {len(undoc) - 50} more | |"
-                )
-            lines.append("")
+                yield f"| ... and {len(undoc) - 50} more | |"
+            yield ""
 
     # --- Recommendations ---
-    lines.append("## Recommendations")
-    lines.append("")
+    yield "## Recommendations"
+    yield ""
     for idx, rec in enumerate(_recommendations(report), 1):
-        lines.append(f"{idx}. {rec}")
-    lines.append("")
+        yield f"{idx}. {rec}"
+    yield ""
 
     # --- Footer ---
-    lines.append("---")
-    lines.append("")
-    lines.append(
+    yield "---"
+    yield ""
+    yield (
         "*This report was generated automatically. "
         "Do not edit manually.*"
     )
-    lines.append("")
+    yield ""
 
-    return "\n".join(lines)
 
+def generate_markdown(report: CoverageReport) -> str:
+    """Render the full Markdown coverage report."""
+    return "\n".join(_render_markdown(report))
 
-def generate_summary(report: CoverageReport) -> str:
-    """Generate a concise summary suitable for GITHUB_STEP_SUMMARY."""
-    lines: List[str] = []
+
+def _render_summary(report: CoverageReport) -> Iterator[str]:
+    """Yield the lines of the GITHUB_STEP_SUMMARY summary."""
     grade = _grade(report.overall_pct)
 
-    lines.append("### Documentation Coverage")
-    lines.append("")
-    lines.append(
+    yield "### Documentation Coverage"
+    yield ""
+    yield (
         f"**{report.overall_pct:.1f}%** overall "
         f"({report.overall_documented}/{report.overall_total}) "
         f"&mdash; Grade: **{grade}**"
     )
-    lines.append("")
-    lines.append("| Category | Coverage |")
-    lines.append("|----------|----------|")
+    yield ""
+    yield "| Category | Coverage |"
+    yield "|----------|----------|"
     for cat in report.categories:
-        lines.append(f"| {cat.category} | {cat.coverage_pct:.1f}% ({cat.documented}/{cat.total}) |")
-    lines.append("")
+        yield f"| {cat.category} | {cat.coverage_pct:.1f}% ({cat.documented}/{cat.total}) |"
+    yield ""
 
     undoc_total = sum(len(c.undocumented_items) for c in report.categories)
     if undoc_total:
-        lines.append(f"**{undoc_total}** item(s) lack documentation coverage.")
+        yield f"**{undoc_total}** item(s) lack documentation coverage."
     else:
-        lines.append("All items are documented.")
-    lines.append("")
+        yield "All items are documented."
+    yield ""
+
 
-    return "\n".join(lines)
+def generate_summary(report: CoverageReport) -> str:
+    """Generate a concise summary suitable for GITHUB_STEP_SUMMARY."""
+    return "\n".join(_render_summary(report))
 
 
 # ---------------------------------------------------------------------------
 # Main orchestration
 # ---------------------------------------------------------------------------
 
-def build_report(root: Path) -> CoverageReport:
-    """Run all analyses and assemble the coverage report."""
+def build_report(root: Path, use_cache: bool = True) -> CoverageReport:
+    """Run all analyses and assemble the coverage report.
+
+    With *use_cache*, C# scan results are reused from ``SCAN_CACHE_PATH``
+    for files whose modification time and size are unchanged.
+    """
     report = CoverageReport(
         generated_at=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
     )
 
-    # Load documentation content once for type-mention scanning.
-    doc_contents = _load_doc_contents(root)
+    # Index identifiers across all docs, and load the few reference docs the
+    # substring checks search once so every check shares the same copy.
+    doc_tokens = _build_doc_token_index(root)
+    doc_contents = _load_reference_docs(root)
+
+    # Scan C# sources once for types, endpoints, and ADR references.
+    type_items, endpoint_items, adr_items = _scan_sources(
+        root, root / SCAN_CACHE_PATH if use_cache else None
+    )
 
     # 1. Public types
-    type_items = _scan_public_types(root)
-    type_result = _check_type_documentation(type_items, doc_contents)
+    type_result = _check_type_documentation(type_items, doc_tokens)
     report.categories.append(type_result)
 
     # 2. API endpoints
-    endpoint_items = _scan_endpoints(root)
-    endpoint_result = _check_endpoint_documentation(endpoint_items, root)
+    endpoint_result = _check_endpoint_documentation(endpoint_items, doc_contents)
     report.categories.append(endpoint_result)
 
     # 3. Configuration options
     config_items = _scan_config_keys(root)
-    config_result = _check_config_documentation(config_items, root)
+    config_result = _check_config_documentation(config_items, doc_contents)
     report.categories.append(config_result)
 
     # 4. Provider implementations
     provider_items = _scan_providers(root)
-    provider_result = _check_provider_documentation(provider_items, root)
+    provider_result = _check_provider_documentation(provider_items, doc_contents)
     report.categories.append(provider_result)
 
     # 5. ADR implementations
-    adr_items = _scan_adr_references(root)
     adr_result = _check_adr_documentation(adr_items, root)
     report.categories.append(adr_result)
 
@@ -799,6 +1106,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=False,
         help="Print a concise summary to stdout (suitable for GITHUB_STEP_SUMMARY).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help=f"Rescan every source file, ignoring {SCAN_CACHE_PATH}.",
+    )
 
     args = parser.parse_args(argv)
 
@@ -814,7 +1127,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     try:
-        report = build_report(root)
+        report = build_report(root, use_cache=not args.no_cache)
     except Exception as exc:
         print(f"Error: failed to build coverage report: {exc}", file=sys.stderr)
         return 1
@@ -22,13 +22,18 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
+import os
 import sys
 import xml.etree.ElementTree as ET
-from dataclasses import asdict, dataclass, field
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 
 # ---------------------------------------------------------------------------
@@ -39,19 +44,45 @@ EXCLUDE_DIRS: frozenset[str] = frozenset({
     '.git', 'node_modules', 'bin', 'obj', '__pycache__', '.vs', 'packages', 'TestResults'
 })
 
+# Below this many project files, process start-up outweighs parallel parsing.
+PARALLEL_PARSE_THRESHOLD = 32
+
+
+def _try_import_lxml() -> Any:
+    """Attempt to import lxml.etree; return the module or None."""
+    try:
+        from lxml import etree  # type: ignore[import-not-found]
+        return etree
+    except ImportError:
+        return None
+
+
+_LXML = _try_import_lxml()
+
+
+def _try_import_orjson() -> Any:
+    """Attempt to import orjson; return the module or None."""
+    try:
+        import orjson  # type: ignore[import-not-found]
+        return orjson
+    except ImportError:
+        return None
+
+
+_ORJSON = _try_import_orjson()
 
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ProjectDependency:
     """Represents a project reference."""
     name: str
     path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageDependency:
     """Represents a NuGet package dependency."""
     name: str
@@ -66,21 +97,47 @@ class ProjectNode:
     project_refs: list[ProjectDependency] = field(default_factory=list)
     package_refs: list[PackageDependency] = field(default_factory=list)
     referenced_by: list[str] = field(default_factory=list)
+    # Derived metrics, refreshed by update_metrics() once the graph is built.
+    _is_leaf: bool = field(init=False, default=True, repr=False)
+    _is_root: bool = field(init=False, default=True, repr=False)
+    _complexity: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        self.update_metrics()
+
+    def update_metrics(self) -> None:
+        """Recompute the cached metrics after the reference lists change."""
+        self._is_leaf = not self.project_refs
+        self._is_root = not self.referenced_by
+        self._complexity = len(self.project_refs) + len(self.package_refs)
 
     @property
     def is_leaf(self) -> bool:
         """Check if project has no dependencies."""
-        return len(self.project_refs) == 0
+        return self._is_leaf
 
     @property
     def is_root(self) -> bool:
         """Check if project is not referenced by others."""
-        return len(self.referenced_by) == 0
+        return self._is_root
 
     @property
     def complexity(self) -> int:
         """Calculate project complexity as total dependency count."""
-        return len(self.project_refs) + len(self.package_refs)
+        return self._complexity
+
+
+def _node_to_dict(proj: ProjectNode) -> dict:
+    """Project a node onto plain dicts and lists, without asdict()'s deep copy."""
+    return {
+        'name': proj.name,
+        'path': proj.path,
+        'project_refs': [{'name': d.name, 'path': d.path} for d in proj.project_refs],
+        'package_refs': [
+            {'name': p.name, 'version': p.version} for p in proj.package_refs
+        ],
+        'referenced_by': proj.referenced_by,
+    }
 
 
 @dataclass
@@ -90,18 +147,39 @@ class DependencyGraph:
     circular_deps: list[list[str]] = field(default_factory=list)
     generated_at: str = ""
 
+    @functools.cached_property
+    def sorted_projects(self) -> tuple[tuple[str, ProjectNode], ...]:
+        """``(name, node)`` pairs in name order, sorted once per graph.
+
+        Computed on first access, so read it only after the graph is built.
+        """
+        return tuple(sorted(self.projects.items()))
+
+    @functools.cached_property
+    def projects_by_complexity(self) -> tuple[ProjectNode, ...]:
+        """Projects from most to fewest dependencies, in discovery order on ties."""
+        return tuple(sorted(self.projects.values(), key=lambda p: -p.complexity))
+
+    def statistics(self) -> dict[str, int]:
+        """Summary counters, computed in one pass without serializing projects."""
+        leaf_projects = root_projects = 0
+        for proj in self.projects.values():
+            leaf_projects += proj.is_leaf
+            root_projects += proj.is_root
+        return {
+            'total_projects': len(self.projects),
+            'leaf_projects': leaf_projects,
+            'root_projects': root_projects,
+            'circular_dependencies': len(self.circular_deps),
+        }
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
-            'projects': {name: asdict(proj) for name, proj in self.projects.items()},
+            'projects': {name: _node_to_dict(proj) for name, proj in self.projects.items()},
             'circular_deps': self.circular_deps,
             'generated_at': self.generated_at,
-            'statistics': {
-                'total_projects': len(self.projects),
-                'leaf_projects': sum(1 for p in self.projects.values() if p.is_leaf),
-                'root_projects': sum(1 for p in self.projects.values() if p.is_root),
-                'circular_dependencies': len(self.circular_deps),
-            }
+            'statistics': self.statistics(),
         }
 
 
@@ -109,85 +187,209 @@ class DependencyGraph:
 # Parsing Functions
 # ---------------------------------------------------------------------------
 
-def _should_skip(path: Path) -> bool:
-    """Check if path should be skipped."""
-    return any(part in EXCLUDE_DIRS for part in path.parts)
+def _walk_csproj(root: Path) -> Iterator[Path]:
+    """Yield every .csproj file under *root*, pruning ``EXCLUDE_DIRS``.
+
+    Excluded directories (``bin/``, ``obj/``, ``node_modules/``, ...) are
+    never descended into.  Each directory's project files are yielded
+    before its subdirectories are walked; symlinked directories are not
+    followed.
+    """
+    try:
+        with os.scandir(root) as entries:
+            subdirs: list[str] = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDE_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.csproj') and entry.is_file():
+                    yield Path(entry.path)
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _walk_csproj(Path(subdir))
+
+
+def _iter_csproj_elements(csproj_path: Path) -> Iterator[Any]:
+    """Stream the elements of *csproj_path*, each yielded as its end tag is read.
+
+    Elements are cleared once the caller has looked at them, and under lxml
+    already-processed siblings are detached too, so the partial tree never
+    grows with the size of the file.
+    """
+    if _LXML is not None:
+        events = _LXML.iterparse(
+            str(csproj_path), events=('end',), collect_ids=False, remove_blank_text=True
+        )
+    else:
+        events = ET.iterparse(str(csproj_path), events=('end',))
+
+    for _event, elem in events:
+        yield elem
+        elem.clear()
+        if _LXML is not None:
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def _stem(include: str) -> str:
+    """Project name from a reference path, accepting ``/`` and ``\\`` separators.
+
+    ``..\\Meridian.Core\\Meridian.Core.csproj`` -> ``Meridian.Core``.  MSBuild
+    paths use Windows separators, which ``Path.stem`` does not split on
+    POSIX, and plain string slicing avoids a ``Path`` allocation per reference.
+    """
+    name = include[max(include.rfind('/'), include.rfind('\\')) + 1:]
+    dot = name.rfind('.')
+    return name[:dot] if dot > 0 else name
 
 
 def _parse_csproj(csproj_path: Path, root: Path) -> Optional[ProjectNode]:
     """Parse a .csproj file and extract dependencies."""
+    intern = sys.intern
+    project_name = intern(csproj_path.stem)
+    rel_path = os.path.relpath(csproj_path, root)
+
+    node = ProjectNode(name=project_name, path=rel_path)
+
+    # Project names are interned: they become the keys of the graph, the
+    # reverse-reference sets and the cycle search's colour map.
     try:
-        tree = ET.parse(csproj_path)
-        xml_root = tree.getroot()
+        for elem in _iter_csproj_elements(csproj_path):
+            tag = elem.tag
+            if tag == 'ProjectReference':
+                include = elem.attrib.get('Include')
+                if include:
+                    # Extract project name from path
+                    ref_project = intern(_stem(include))
+                    node.project_refs.append(ProjectDependency(
+                        name=ref_project,
+                        path=include
+                    ))
+            elif tag == 'PackageReference':
+                attrib = elem.attrib
+                name = attrib.get('Include')
+                version = attrib.get('Version', '')
+                if name:
+                    node.package_refs.append(PackageDependency(
+                        name=name,
+                        version=version
+                    ))
     except Exception as e:
         print(f"Warning: Could not parse {csproj_path}: {e}", file=sys.stderr)
         return None
 
-    project_name = csproj_path.stem
-    try:
-        rel_path = str(csproj_path.relative_to(root))
-    except ValueError:
-        rel_path = str(csproj_path)
+    return node
 
-    node = ProjectNode(name=project_name, path=rel_path)
 
-    # Extract ProjectReference elements
-    for ref in xml_root.findall('.//ProjectReference'):
-        include = ref.get('Include')
-        if include:
-            # Extract project name from path
-            ref_project = Path(include).stem
-            node.project_refs.append(ProjectDependency(
-                name=ref_project,
-                path=include
-            ))
-
-    # Extract PackageReference elements
-    for pkg in xml_root.findall('.//PackageReference'):
-        name = pkg.get('Include')
-        version = pkg.get('Version', '')
-        if name:
-            node.package_refs.append(PackageDependency(
-                name=name,
-                version=version
-            ))
+# Picklable form of a parsed project: (name, path, project_refs, package_refs).
+ParsedProject = tuple[str, str, list[tuple[str, str]], list[tuple[str, str]]]
+
+
+def _parse_csproj_worker(csproj_path: Path, root: Path) -> Optional[ParsedProject]:
+    """Parse one .csproj in a worker process and flatten it to plain tuples."""
+    node = _parse_csproj(csproj_path, root)
+    if node is None:
+        return None
+    return (
+        node.name,
+        node.path,
+        [(dep.name, dep.path) for dep in node.project_refs],
+        [(pkg.name, pkg.version) for pkg in node.package_refs],
+    )
 
-    return node
+
+def _parse_csproj_files(paths: list[Path], root: Path) -> Iterator[ProjectNode]:
+    """Parse *paths* in order, fanning out to a process pool for large repos."""
+    if len(paths) < PARALLEL_PARSE_THRESHOLD:
+        for csproj in paths:
+            node = _parse_csproj(csproj, root)
+            if node:
+                yield node
+        return
+
+    worker = functools.partial(_parse_csproj_worker, root=root)
+    with ProcessPoolExecutor() as executor:
+        for parsed in executor.map(worker, paths, chunksize=16):
+            if parsed is None:
+                continue
+            name, path, project_refs, package_refs = parsed
+            yield ProjectNode(
+                name=name,
+                path=path,
+                project_refs=[ProjectDependency(n, p) for n, p in project_refs],
+                package_refs=[PackageDependency(n, v) for n, v in package_refs],
+            )
 
 
 def _detect_circular_deps(graph: dict[str, ProjectNode]) -> list[list[str]]:
-    """Detect circular dependencies using DFS."""
-    circular = []
-    visited = set()
-    rec_stack = set()
-    path = []
-
-    def dfs(node_name: str):
-        if node_name in rec_stack:
-            # Found a cycle
-            cycle_start = path.index(node_name)
-            cycle = path[cycle_start:] + [node_name]
-            circular.append(cycle)
-            return
-
-        if node_name in visited:
-            return
-
-        visited.add(node_name)
-        rec_stack.add(node_name)
-        path.append(node_name)
-
-        node = graph.get(node_name)
-        if node:
-            for dep in node.project_refs:
-                dfs(dep.name)
-
-        path.pop()
-        rec_stack.remove(node_name)
-
-    for project_name in graph:
-        if project_name not in visited:
-            dfs(project_name)
+    """Detect circular dependencies using an iterative three-colour DFS.
+
+    Projects that cannot reach a cycle are peeled off first.  The rest are
+    WHITE (unvisited), GRAY (on the current path) or BLACK (fully
+    explored).  Reaching a GRAY node closes a cycle; BLACK nodes are never
+    re-entered.  An explicit stack replaces recursion, so arbitrarily deep
+    reference chains cannot hit the interpreter's recursion limit.
+    """
+    white, gray, black = 0, 1, 2
+    circular: list[list[str]] = []
+    color: dict[str, int] = {}
+
+    # Compact adjacency tuples of interned names: the walk iterates plain
+    # strings per edge, and colour lookups can match on identity.
+    intern = sys.intern
+    adj: dict[str, tuple[str, ...]] = {
+        intern(name): tuple(intern(dep.name) for dep in node.project_refs)
+        for name, node in graph.items()
+    }
+
+    # Peel the acyclic fringe first (Kahn's algorithm on out-degree): a
+    # project whose dependencies are all peeled cannot reach a cycle, so it
+    # is finished up front and the DFS below only walks the cyclic core.
+    # Peeled projects can never lead back to a node on the DFS path, so
+    # skipping them leaves the reported cycles unchanged.
+    dependents: dict[str, list[str]] = {name: [] for name in adj}
+    out_degree: dict[str, int] = {}
+    for name, deps in adj.items():
+        known = [dep for dep in deps if dep in dependents]
+        out_degree[name] = len(known)
+        for dep in known:
+            dependents[dep].append(name)
+    fringe = deque(name for name, degree in out_degree.items() if degree == 0)
+    while fringe:
+        name = fringe.popleft()
+        color[name] = black
+        for dependent in dependents[name]:
+            out_degree[dependent] -= 1
+            if out_degree[dependent] == 0:
+                fringe.append(dependent)
+
+    for project_name in adj:
+        if color.get(project_name, white) != white:
+            continue
+
+        color[project_name] = gray
+        path = [project_name]
+        stack = [iter(adj[project_name])]
+        while stack:
+            for dep_name in stack[-1]:
+                state = color.get(dep_name, white)
+                if state == gray:
+                    # Found a cycle
+                    cycle_start = path.index(dep_name)
+                    circular.append(path[cycle_start:] + [dep_name])
+                elif state == white:
+                    if not adj.get(dep_name):
+                        # Leaves cannot close a cycle; finish them in place.
+                        color[dep_name] = black
+                        continue
+                    color[dep_name] = gray
+                    path.append(dep_name)
+                    stack.append(iter(adj[dep_name]))
+                    break
+            else:
+                stack.pop()
+                color[path.pop()] = black
 
     return circular
 
@@ -198,20 +400,22 @@ def build_dependency_graph(root: Path) -> DependencyGraph:
         generated_at=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     )
 
-    # Find all .csproj files
-    for csproj in root.rglob("*.csproj"):
-        if _should_skip(csproj):
-            continue
+    # Find all .csproj files, then parse them
+    paths = list(_walk_csproj(root))
+    for node in _parse_csproj_files(paths, root):
+        graph.projects[node.name] = node
 
-        node = _parse_csproj(csproj, root)
-        if node:
-            graph.projects[node.name] = node
-
-    # Build reverse reference map
+    # Build reverse reference map; a project that references the same
+    # dependency more than once (e.g. under different conditions) counts once.
+    referenced_by: defaultdict[str, set[str]] = defaultdict(set)
     for node in graph.projects.values():
         for dep in node.project_refs:
             if dep.name in graph.projects:
-                graph.projects[dep.name].referenced_by.append(node.name)
+                referenced_by[dep.name].add(node.name)
+    for name, refs in referenced_by.items():
+        graph.projects[name].referenced_by = sorted(refs)
+    for node in graph.projects.values():
+        node.update_metrics()
 
     # Detect circular dependencies
     graph.circular_deps = _detect_circular_deps(graph.projects)
@@ -232,14 +436,14 @@ def generate_dot(graph: DependencyGraph) -> str:
     lines.append('')
 
     # Add nodes
-    for name, node in sorted(graph.projects.items()):
+    for name, node in graph.sorted_projects:
         color = 'lightblue' if node.is_root else ('lightgreen' if node.is_leaf else 'white')
         lines.append(f'    "{name}" [fillcolor={color}, style=filled];')
 
     lines.append('')
 
     # Add edges
-    for name, node in sorted(graph.projects.items()):
+    for name, node in graph.sorted_projects:
         for dep in node.project_refs:
             lines.append(f'    "{name}" -> "{dep.name}";')
 
@@ -247,132 +451,164 @@ def generate_dot(graph: DependencyGraph) -> str:
     return '\n'.join(lines)
 
 
+# Characters that are not valid in Mermaid node ids, mapped to underscores.
+_MERMAID_ID_TABLE = str.maketrans({'-': '_', '.': '_'})
+
+
 def generate_mermaid(graph: DependencyGraph) -> str:
     """Generate Mermaid diagram syntax."""
     lines = []
     lines.append('```mermaid')
     lines.append('graph LR')
 
-    for name, node in sorted(graph.projects.items()):
-        safe_name = name.replace('-', '_').replace('.', '_')
+    # Mermaid node ids, computed once per name; references to projects that
+    # were not discovered are added as they are met.
+    safe = {name: name.translate(_MERMAID_ID_TABLE) for name in graph.projects}
+    for name, node in graph.sorted_projects:
+        safe_name = safe[name]
         for dep in node.project_refs:
-            safe_dep = dep.name.replace('-', '_').replace('.', '_')
+            safe_dep = safe.get(dep.name)
+            if safe_dep is None:
+                safe_dep = safe[dep.name] = dep.name.translate(_MERMAID_ID_TABLE)
             lines.append(f'    {safe_name}[{name}] --> {safe_dep}[{dep.name}]')
 
     lines.append('```')
     return '\n'.join(lines)
 
 
+# Row templates for the repeated Markdown table and list lines.
+_SUMMARY_ROW = '| {label} | {value} |\n'
+_COMPLEX_ROW = '| {name} | {project_deps} | {package_deps} | {total} |\n'
+_PACKAGE_ITEM = '- {name}{version}\n'
+
+
+def _project_section(name: str, proj: ProjectNode) -> str:
+    """Render the "Project Details" section for one project."""
+    buf = io.StringIO()
+    w = buf.write
+    w(f'### {name}\n')
+    w('\n')
+    w(f'**Path:** `{proj.path}`\n')
+    w('\n')
+
+    if proj.project_refs:
+        w('**Project References:**\n')
+        for dep_name in sorted(dep.name for dep in proj.project_refs):
+            w(f'- {dep_name}\n')
+        w('\n')
+
+    if proj.referenced_by:
+        w('**Referenced By:**\n')
+        for ref in sorted(proj.referenced_by):
+            w(f'- {ref}\n')
+        w('\n')
+
+    if proj.package_refs:
+        w(f'**NuGet Packages ({len(proj.package_refs)}):**\n')
+        for pkg in sorted(proj.package_refs, key=lambda p: p.name)[:10]:
+            w(_PACKAGE_ITEM.format_map({
+                'name': pkg.name,
+                'version': f' ({pkg.version})' if pkg.version else '',
+            }))
+        if len(proj.package_refs) > 10:
+            w(f'- ... and {len(proj.package_refs) - 10} more\n')
+        w('\n')
+
+    return buf.getvalue()
+
+
 def generate_markdown(graph: DependencyGraph) -> str:  # noqa: C901
     """Generate Markdown dependency report."""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
-    lines.append('# Project Dependency Graph')
-    lines.append('')
-    lines.append(f'> Generated: {graph.generated_at}')
-    lines.append('')
+    w('# Project Dependency Graph\n')
+    w('\n')
+    w(f'> Generated: {graph.generated_at}\n')
+    w('\n')
 
     # Summary
-    stats = graph.to_dict()['statistics']
-    lines.append('## Summary')
-    lines.append('')
-    lines.append('| Metric | Value |')
-    lines.append('|--------|-------|')
-    lines.append(f"| Total Projects | {stats['total_projects']} |")
-    lines.append(f"| Root Projects | {stats['root_projects']} |")
-    lines.append(f"| Leaf Projects | {stats['leaf_projects']} |")
-    lines.append(f"| Circular Dependencies | {stats['circular_dependencies']} |")
-    lines.append('')
+    stats = graph.statistics()
+    w('## Summary\n')
+    w('\n')
+    w('| Metric | Value |\n')
+    w('|--------|-------|\n')
+    for label, key in (
+        ('Total Projects', 'total_projects'),
+        ('Root Projects', 'root_projects'),
+        ('Leaf Projects', 'leaf_projects'),
+        ('Circular Dependencies', 'circular_dependencies'),
+    ):
+        w(_SUMMARY_ROW.format_map({'label': label, 'value': stats[key]}))
+    w('\n')
 
     # Circular dependencies
     if graph.circular_deps:
-        lines.append('## ⚠️ Circular Dependencies')
-        lines.append('')
-        lines.append('The following circular dependencies were detected:')
-        lines.append('')
+        w('## ⚠️ Circular Dependencies\n')
+        w('\n')
+        w('The following circular dependencies were detected:\n')
+        w('\n')
         for cycle in graph.circular_deps:
             cycle_str = ' → '.join(cycle)
-            lines.append(f'- {cycle_str}')
-        lines.append('')
+            w(f'- {cycle_str}\n')
+        w('\n')
 
     # Root projects (entry points)
-    root_projects = [p for p in graph.projects.values() if p.is_root]
+    root_projects = [p for _name, p in graph.sorted_projects if p.is_root]
     if root_projects:
-        lines.append('## Entry Point Projects')
-        lines.append('')
-        lines.append('These projects are not referenced by other projects:')
-        lines.append('')
-        for proj in sorted(root_projects, key=lambda p: p.name):
-            lines.append(f'- **{proj.name}**')
+        w('## Entry Point Projects\n')
+        w('\n')
+        w('These projects are not referenced by other projects:\n')
+        w('\n')
+        for proj in root_projects:
+            w(f'- **{proj.name}**\n')
             if proj.project_refs:
-                lines.append(f'  - Dependencies: {len(proj.project_refs)}')
+                w(f'  - Dependencies: {len(proj.project_refs)}\n')
             if proj.package_refs:
-                lines.append(f'  - NuGet Packages: {len(proj.package_refs)}')
-        lines.append('')
+                w(f'  - NuGet Packages: {len(proj.package_refs)}\n')
+        w('\n')
 
     # Complexity ranking
-    complex_projects = sorted(graph.projects.values(), key=lambda p: -p.complexity)[:10]
+    complex_projects = graph.projects_by_complexity[:10]
     if complex_projects:
-        lines.append('## Most Complex Projects')
-        lines.append('')
-        lines.append('Projects with the most dependencies:')
-        lines.append('')
-        lines.append('| Project | Project Deps | Package Deps | Total |')
-        lines.append('|---------|--------------|--------------|-------|')
+        w('## Most Complex Projects\n')
+        w('\n')
+        w('Projects with the most dependencies:\n')
+        w('\n')
+        w('| Project | Project Deps | Package Deps | Total |\n')
+        w('|---------|--------------|--------------|-------|\n')
         for proj in complex_projects:
-            lines.append(
-                f'| {proj.name} | {len(proj.project_refs)} | '
-                f'{len(proj.package_refs)} | {proj.complexity} |'
-            )
-        lines.append('')
+            w(_COMPLEX_ROW.format_map({
+                'name': proj.name,
+                'project_deps': len(proj.project_refs),
+                'package_deps': len(proj.package_refs),
+                'total': proj.complexity,
+            }))
+        w('\n')
 
     # Dependency graph (Mermaid)
-    lines.append('## Dependency Graph')
-    lines.append('')
-    lines.append(generate_mermaid(graph))
-    lines.append('')
+    w('## Dependency Graph\n')
+    w('\n')
+    w(generate_mermaid(graph))
+    w('\n')
+    w('\n')
 
     # Project details
-    lines.append('## Project Details')
-    lines.append('')
-    for name, proj in sorted(graph.projects.items()):
-        lines.append(f'### {name}')
-        lines.append('')
-        lines.append(f'**Path:** `{proj.path}`')
-        lines.append('')
-
-        if proj.project_refs:
-            lines.append('**Project References:**')
-            for dep in sorted(proj.project_refs, key=lambda d: d.name):
-                lines.append(f'- {dep.name}')
-            lines.append('')
-
-        if proj.referenced_by:
-            lines.append('**Referenced By:**')
-            for ref in sorted(proj.referenced_by):
-                lines.append(f'- {ref}')
-            lines.append('')
-
-        if proj.package_refs:
-            lines.append(f'**NuGet Packages ({len(proj.package_refs)}):**')
-            for pkg in sorted(proj.package_refs, key=lambda p: p.name)[:10]:
-                version_str = f' ({pkg.version})' if pkg.version else ''
-                lines.append(f'- {pkg.name}{version_str}')
-            if len(proj.package_refs) > 10:
-                lines.append(f'- ... and {len(proj.package_refs) - 10} more')
-            lines.append('')
-
-    lines.append('---')
-    lines.append('')
-    lines.append('*This report is auto-generated. Run `python3 build/scripts/docs/generate-dependency-graph.py` to regenerate.*')  # noqa: E501
-    lines.append('')
+    w('## Project Details\n')
+    w('\n')
+    for name, proj in graph.sorted_projects:
+        w(_project_section(name, proj))
 
-    return '\n'.join(lines)
+    w('---\n')
+    w('\n')
+    w('*This report is auto-generated. Run `python3 build/scripts/docs/generate-dependency-graph.py` to regenerate.*\n')  # noqa: E501
+
+    return buf.getvalue()
 
 
 def generate_summary(graph: DependencyGraph) -> str:
     """Generate concise summary."""
-    stats = graph.to_dict()['statistics']
+    stats = graph.statistics()
     circular_warning = f" ⚠️ {stats['circular_dependencies']} circular!" if stats['circular_dependencies'] > 0 else ""
 
     return (
@@ -384,6 +620,51 @@ def generate_summary(graph: DependencyGraph) -> str:
     )
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode the graph dataclasses one object at a time during serialization.
+
+    Nested lists are handed back as-is for the encoder to walk, so no copy
+    of the whole graph is materialized first.
+    """
+    if isinstance(obj, ProjectNode):
+        return {
+            'name': obj.name,
+            'path': obj.path,
+            'project_refs': obj.project_refs,
+            'package_refs': obj.package_refs,
+            'referenced_by': obj.referenced_by,
+        }
+    if isinstance(obj, ProjectDependency):
+        return {'name': obj.name, 'path': obj.path}
+    if isinstance(obj, PackageDependency):
+        return {'name': obj.name, 'version': obj.version}
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _json_shape(graph: DependencyGraph) -> dict:
+    """The ``to_dict()`` layout, referencing the live projects instead of copies."""
+    return {
+        'projects': graph.projects,
+        'circular_deps': graph.circular_deps,
+        'generated_at': graph.generated_at,
+        'statistics': graph.statistics(),
+    }
+
+
+def _json_dumps(data: dict) -> str:
+    """Serialize *data* as two-space indented JSON, using orjson when installed.
+
+    Graph dataclasses inside *data* are encoded through ``_json_default``.
+    """
+    if _ORJSON is not None:
+        return _ORJSON.dumps(
+            data,
+            default=_json_default,
+            option=_ORJSON.OPT_INDENT_2 | _ORJSON.OPT_PASSTHROUGH_DATACLASS,
+        ).decode('utf-8')
+    return json.dumps(data, indent=2, default=_json_default)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -440,7 +721,7 @@ def main(argv: Optional[list[str]] = None) -> int:  # noqa: C901
     elif args.format == 'mermaid':
         content = generate_mermaid(graph)
     elif args.format == 'json':
-        content = json.dumps(graph.to_dict(), indent=2)
+        content = _json_dumps(_json_shape(graph))
 
     # Write output
     if args.output:
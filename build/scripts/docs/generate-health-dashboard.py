@@ -27,16 +27,34 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import heapq
+import io
 import json
+import mmap
+import os
 import re
 import subprocess
 import sys
-from dataclasses import asdict, dataclass, field
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Sequence
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
 
 
+def _try_import_orjson() -> Any:
+    """Attempt to import orjson; return the module or None."""
+    try:
+        import orjson  # type: ignore[import-not-found]
+        return orjson
+    except ImportError:
+        return None
+
+
+_ORJSON = _try_import_orjson()
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -47,10 +65,22 @@ EXCLUDE_DIRS: frozenset[str] = frozenset(
 
 STALE_THRESHOLD_DAYS: int = 90
 
+# Upper bound on the ``git log`` used for last-modified dates.
+GIT_TIMEOUT_SECONDS: int = 60
+
+# Bytes requested per read of the streamed ``git log`` output.
+_GIT_READ_SIZE = 64 * 1024
+
+# Files at least this large are memory-mapped instead of read into a buffer.
+MMAP_THRESHOLD: int = 64 * 1024
+
 # Patterns that count as "TODO" markers inside documentation files.
 _TODO_PATTERN: re.Pattern[str] = re.compile(
     r"\b(TODO|FIXME|HACK|XXX)\b", re.IGNORECASE
 )
+_TODO_BYTES_PATTERN: re.Pattern[bytes] = re.compile(
+    _TODO_PATTERN.pattern.encode(), re.IGNORECASE
+)
 
 # Pattern used to extract Markdown links to other files.
 # Matches [text](path) where path ends with .md (optional fragment / query).
@@ -58,8 +88,15 @@ _MD_LINK_PATTERN: re.Pattern[str] = re.compile(
     r"\[(?:[^\]]*)\]\(([^)]+\.md(?:#[^)]*)?)\)"
 )
 
-# Headings: lines starting with one or more '#'.
-_HEADING_PATTERN: re.Pattern[str] = re.compile(r"^\s*#{1,6}\s+\S")
+# Characters ``str.splitlines`` treats as line boundaries.
+_LINE_BREAKS = r"\n\r\v\f\x1c-\x1e\x85\u2028\u2029"
+
+# Headings: lines starting with one or more '#'. Searched against the whole
+# file, so "start of line" and "whitespace" are spelled out to never cross a
+# line boundary, matching exactly the lines ``splitlines`` would produce.
+_HEADING_PATTERN: re.Pattern[str] = re.compile(
+    rf"(?<![^{_LINE_BREAKS}])[^\S{_LINE_BREAKS}]*#{{1,6}}[^\S{_LINE_BREAKS}]+\S"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -103,9 +140,14 @@ class HealthMetrics:
     root_dir: str = ""
 
     def to_dict(self) -> dict:
-        """Serialise to a plain dictionary (JSON-friendly)."""
-        data = asdict(self)
-        # ``all_files`` already serialises via ``asdict``.
+        """Serialise to a plain dictionary (JSON-friendly).
+
+        Built from the instance ``__dict__`` rather than ``asdict``, which
+        deep-copies every ``FileInfo`` and list.  The returned dictionary
+        shares the lists and per-file mappings with this object.
+        """
+        data = dict(self.__dict__)
+        data["all_files"] = [info.__dict__ for info in self.all_files]
         return data
 
 
@@ -114,55 +156,175 @@ class HealthMetrics:
 # ---------------------------------------------------------------------------
 
 
-def _should_skip(path: Path) -> bool:
-    """Return *True* when *path* resides under an excluded directory."""
-    for part in path.parts:
-        if part in EXCLUDE_DIRS:
-            return True
-    return False
+def _iter_md(root: str) -> Iterator[os.DirEntry[str]]:
+    """Yield the Markdown file entries under *root*, pruning ``EXCLUDE_DIRS``.
 
+    Excluded directories are never descended into.  Each directory's files
+    are yielded before its subdirectories are walked, and symlinked
+    directories are not followed.
+    """
+    # An explicit stack keeps each file one generator hop from the caller,
+    # rather than one per directory level as with recursive ``yield from``.
+    pending: list[str] = [root]
+    while pending:
+        directory = pending.pop()
+        subdirs: list[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDE_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        yield entry
+        except OSError as exc:
+            print(f"Warning: could not scan {directory}: {exc}", file=sys.stderr)
+        # Reversed so subdirectories are still walked in scan order.
+        pending.extend(reversed(subdirs))
 
-def _read_text_safe(path: Path) -> Optional[str]:
-    """Read a file as UTF-8, returning *None* on failure."""
-    try:
-        return path.read_text(encoding="utf-8", errors="replace")
-    except (OSError, PermissionError) as exc:
-        print(f"Warning: could not read {path}: {exc}", file=sys.stderr)
-        return None
 
+def _decode_markdown(data: bytes | mmap.mmap) -> str:
+    """Decode file bytes as UTF-8 with universal newlines, like ``read_text``."""
+    text = str(data, "utf-8", "replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _count_todos(content: str) -> int:
+    """Count the TODO markers in *content*."""
+    # Markers are single words, so one scan of the whole file finds exactly
+    # the matches a per-line scan would.
+    return sum(1 for _ in _TODO_PATTERN.finditer(content))
+
+
+def _read_markdown(path: str) -> tuple[str, int]:
+    """Read *path* as UTF-8 text and count its TODO markers.
+
+    Files of at least ``MMAP_THRESHOLD`` bytes are memory-mapped.  When such
+    a file is pure ASCII its markers are counted by a bytes pattern run over
+    the mapping, which is cheaper than the Unicode-aware ``str`` pattern and
+    finds the same matches in ASCII text.
 
-def _git_last_commit_date(path: Path, root: Path) -> Optional[datetime]:
-    """Return the last git commit date for *path*, or *None*."""
+    Returns ``("", 0)`` when the file cannot be read.
+    """
+    try:
+        with open(path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size < MMAP_THRESHOLD:
+                content = _decode_markdown(fh.read())
+            else:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = _decode_markdown(mm)
+                    if content.isascii():
+                        return content, len(_TODO_BYTES_PATTERN.findall(mm))
+    except (OSError, ValueError) as exc:
+        print(f"Warning: could not read {path}: {exc}", file=sys.stderr)
+        return "", 0
+    return content, _count_todos(content)
+
+
+def _git_last_commit_dates(
+    root: Path, wanted: Iterable[str]
+) -> dict[str, datetime]:
+    """Map each Markdown file under *root* to its last git commit date.
+
+    A single ``git log`` over the history replaces one subprocess per file;
+    the first (newest) date seen for a path wins.  The log is streamed and
+    git is stopped as soon as every path in *wanted* has a date, so history
+    older than the oldest last-touched file is never walked.  Keys are paths
+    relative to *root* with git's ``/`` separators (see ``_git_path``).
+    Returns an empty mapping when git is unavailable or *root* is not inside
+    a work tree.
+    """
+    remaining = {_git_path(rel) for rel in wanted}
     try:
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%aI", "--", str(path)],
-            capture_output=True,
-            text=True,
+        proc = subprocess.Popen(
+            [
+                "git", "log", "-z", "--name-only", "--format=%x01%aI",
+                "--relative", "--", "*.md",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             cwd=str(root),
-            timeout=10,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return datetime.fromisoformat(result.stdout.strip())
-    except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-        pass
-    return None
-
-
-def _file_mtime_utc(path: Path) -> datetime:
-    """Return the file modification time in UTC."""
-    ts = path.stat().st_mtime
+    except OSError:
+        return {}
+    timer = threading.Timer(GIT_TIMEOUT_SECONDS, proc.kill)
+    timer.start()
+
+    # Records look like "\x01<date>\0\n<path>\0<path>\0...".  Only records
+    # followed by the next "\x01" are known to be complete.
+    dates: dict[str, datetime] = {}
+    pending = b""
+    stopped_early = False
+    try:
+        with proc.stdout:
+            while remaining:
+                chunk = proc.stdout.read1(_GIT_READ_SIZE)
+                if not chunk:
+                    break
+                *records, pending = (pending + chunk).split(b"\x01")
+                _add_git_dates(records, dates, remaining)
+            else:
+                stopped_early = True
+                proc.kill()
+            if not stopped_early:
+                _add_git_dates([pending], dates, remaining)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+    if not stopped_early and returncode != 0:
+        return {}
+    return dates
+
+
+def _add_git_dates(
+    records: Iterable[bytes], dates: dict[str, datetime], remaining: set[str]
+) -> None:
+    """Record the commit date of each path in *records* not yet in *dates*."""
+    for record in records:
+        header, _, names = record.partition(b"\0")
+        commit_date: Optional[datetime] = None
+        for name in names.lstrip(b"\n").split(b"\0"):
+            if not name:
+                continue
+            rel = os.fsdecode(name)
+            if rel in dates:
+                continue
+            if commit_date is None:
+                commit_date = datetime.fromisoformat(header.decode("ascii"))
+            dates[rel] = commit_date
+            remaining.discard(rel)
+
+
+def _git_path(rel: str) -> str:
+    """Return the walked relative path *rel* with git's ``/`` separators."""
+    return rel if os.sep == "/" else rel.replace(os.sep, "/")
+
+
+def _file_mtime_utc(entry: os.DirEntry[str]) -> datetime:
+    """Return the file modification time in UTC.
+
+    ``DirEntry.stat`` reuses the data gathered by the directory scan where
+    the platform provides it (Windows) and caches the result otherwise.
+    """
+    ts = entry.stat().st_mtime
     return datetime.fromtimestamp(ts, tz=timezone.utc)
 
 
-def _last_modified(path: Path, root: Path) -> datetime:
-    """Best-effort last-modified date: git commit date or file mtime."""
-    git_date = _git_last_commit_date(path, root)
+def _last_modified(
+    entry: os.DirEntry[str], rel: str, git_dates: dict[str, datetime]
+) -> datetime:
+    """Best-effort last-modified date: git commit date or file mtime.
+
+    *git_dates* is the ``_git_last_commit_dates`` mapping, looked up by the
+    repo-relative path *rel* in git's form.  Its dates come from ``%aI`` and always carry
+    a UTC offset.  The file is only stat-ed when git has no date for it.
+    """
+    git_date = git_dates.get(_git_path(rel))
     if git_date is not None:
-        # Ensure timezone-aware
-        if git_date.tzinfo is None:
-            git_date = git_date.replace(tzinfo=timezone.utc)
         return git_date
-    return _file_mtime_utc(path)
+    return _file_mtime_utc(entry)
 
 
 # ---------------------------------------------------------------------------
@@ -170,9 +332,17 @@ def _last_modified(path: Path, root: Path) -> datetime:
 # ---------------------------------------------------------------------------
 
 
-def _normalise_link_target(link: str, source_dir: Path, root: Path) -> Optional[str]:
+@functools.lru_cache(maxsize=4096)
+def _normalise_link_target(link: str, source_dir: str, root: str) -> Optional[str]:
     """Resolve a Markdown link target to a repo-relative path string.
 
+    The target is normalised textually, without touching the filesystem:
+    *root* is the already-resolved repository root and links are not
+    followed through symlinks.
+
+    Docs link to the same targets over and over, so results are memoised
+    per ``(link, source_dir, root)``.
+
     Returns *None* when the target is an absolute URL or cannot be resolved.
     """
     # Strip fragment / query parts.
@@ -182,63 +352,42 @@ def _normalise_link_target(link: str, source_dir: Path, root: Path) -> Optional[
     # Skip absolute URLs.
     if link.startswith(("http://", "https://", "mailto:")):
         return None
-    resolved = (source_dir / link).resolve()
-    try:
-        return str(resolved.relative_to(root.resolve()))
-    except ValueError:
+    resolved = os.path.normpath(os.path.join(source_dir, link))
+    if resolved == root:
+        return "."
+    prefix = root if root.endswith(os.sep) else root + os.sep
+    if not resolved.startswith(prefix):
         return None
+    return resolved[len(prefix):]
 
 
-def _collect_links(
-    md_files: Sequence[Path], root: Path
-) -> dict[str, set[str]]:
-    """Build a mapping ``{source_rel_path: {target_rel_paths ...}}``."""
-    links: dict[str, set[str]] = {}
-    for md_path in md_files:
-        content = _read_text_safe(md_path)
-        if content is None:
-            continue
-        try:
-            source_rel = str(md_path.relative_to(root))
-        except ValueError:
-            continue
-        targets: set[str] = set()
-        for match in _MD_LINK_PATTERN.finditer(content):
-            target = _normalise_link_target(match.group(1), md_path.parent, root)
-            if target is not None:
-                targets.add(target)
-        links[source_rel] = targets
-    return links
+def _extract_links(content: str, source_dir: str, root: str) -> set[str]:
+    """Return the repo-relative targets of the Markdown links in *content*."""
+    targets: set[str] = set()
+    for match in _MD_LINK_PATTERN.finditer(content):
+        target = _normalise_link_target(match.group(1), source_dir, root)
+        if target is not None:
+            targets.add(target)
+    return targets
 
 
 def _find_orphans(
-    md_files: Sequence[Path], root: Path
+    all_rel: Iterable[str], linked_targets: set[str]
 ) -> list[str]:
-    """Return repo-relative paths of Markdown files not linked by any other file."""
-    link_map = _collect_links(md_files, root)
-
-    # Set of all files that are the *target* of at least one link.
-    linked_targets: set[str] = set()
-    for targets in link_map.values():
-        linked_targets.update(targets)
-
-    all_rel: set[str] = set()
-    for md_path in md_files:
-        try:
-            all_rel.add(str(md_path.relative_to(root)))
-        except ValueError:
-            pass
+    """Return the paths in *all_rel* that no Markdown file links to.
 
+    *linked_targets* is the union of every file's link targets, gathered
+    while the files were analysed so no file is read a second time.
+    """
     # A file is orphaned if no other file links to it.
     # Exception: top-level entry-point files are not considered orphans.
+    # Only the unlinked files are filtered and sorted.
     entry_points = {"README.md", "CLAUDE.md", "LICENSE", "CHANGELOG.md"}
-    orphans: list[str] = []
-    for rel_path in sorted(all_rel):
-        if Path(rel_path).name in entry_points:
-            continue
-        if rel_path not in linked_targets:
-            orphans.append(rel_path)
-    return orphans
+    return sorted(
+        rel_path
+        for rel_path in set(all_rel).difference(linked_targets)
+        if os.path.basename(rel_path) not in entry_points
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -246,23 +395,46 @@ def _find_orphans(
 # ---------------------------------------------------------------------------
 
 
-def _analyse_file(path: Path, root: Path, now: datetime) -> FileInfo:
-    """Analyse a single Markdown file and return its metadata."""
-    content = _read_text_safe(path) or ""
-    lines = content.splitlines()
-    line_count = len(lines)
-    has_heading = any(_HEADING_PATTERN.match(line) for line in lines)
-    todo_count = sum(1 for line in lines for _ in _TODO_PATTERN.finditer(line))
+def _relative_path(path: str, root: str) -> str:
+    """Return *path*, found by walking *root*, relative to *root*.
 
-    last_mod = _last_modified(path, root)
-    stale = (now - last_mod).days > STALE_THRESHOLD_DAYS
+    Every walked path starts with *root*, so this is a plain slice.
+    """
+    return path[len(root) if root.endswith(os.sep) else len(root) + 1:]
 
-    try:
-        rel = str(path.relative_to(root))
-    except ValueError:
-        rel = str(path)
 
-    return FileInfo(
+def _analyse_file(
+    entry: os.DirEntry[str],
+    root: str,
+    now: datetime,
+    git_dates: dict[str, datetime],
+) -> tuple[FileInfo, set[str]]:
+    """Analyse the Markdown file found by the walk as *entry*.
+
+    *root* is the resolved repository root the walk started from.
+
+    Returns:
+        The file's metadata and the repo-relative targets of its Markdown
+        links, both taken from a single read of the file.
+    """
+    path = entry.path
+    content, todo_count = _read_markdown(path)
+    # Content has universal newlines, so counting "\n" (plus an unterminated
+    # last line) counts lines without building a list of them.
+    line_count = content.count("\n") + (
+        1 if content and not content.endswith("\n") else 0
+    )
+    # The search stops at the first heading, which is usually near the top.
+    # Files without one are scanned in full, so rule out the common case of
+    # no '#' at all with a cheap substring test first.
+    has_heading = "#" in content and _HEADING_PATTERN.search(content) is not None
+
+    rel = _relative_path(path, root)
+
+    last_mod = _last_modified(entry, rel, git_dates)
+    stale = (now - last_mod).days > STALE_THRESHOLD_DAYS
+
+    info = FileInfo(
         path=rel,
         line_count=line_count,
         has_heading=has_heading,
@@ -270,6 +442,7 @@ def _analyse_file(path: Path, root: Path, now: datetime) -> FileInfo:
         last_modified_utc=last_mod.isoformat(),
         stale=stale,
     )
+    return info, _extract_links(content, os.path.dirname(path), root)
 
 
 def compute_health_score(metrics: HealthMetrics) -> int:
@@ -322,12 +495,7 @@ def analyse(root: Path) -> HealthMetrics:
     now = datetime.now(tz=timezone.utc)
 
     # Discover all Markdown files, respecting exclusions.
-    md_files: list[Path] = []
-    for md_path in root.rglob("*.md"):
-        if _should_skip(md_path.relative_to(root)):
-            continue
-        if md_path.is_file():
-            md_files.append(md_path)
+    md_files = list(_iter_md(str(root)))
 
     # Per-file analysis.
     file_infos: list[FileInfo] = []
@@ -336,8 +504,25 @@ def analyse(root: Path) -> HealthMetrics:
     no_heading_files: list[str] = []
     stale_files: list[str] = []
 
-    for md_path in md_files:
-        info = _analyse_file(md_path, root, now)
+    # Last commit dates for every file, from one git invocation.
+    root_str = str(root)
+    git_dates = _git_last_commit_dates(
+        root, (_relative_path(entry.path, root_str) for entry in md_files)
+    )
+
+    linked_targets: set[str] = set()
+
+    # Files are independent and the work is dominated by reads and stats,
+    # which release the GIL, so a thread pool overlaps them.
+    analyse_one = functools.partial(
+        _analyse_file, root=root_str, now=now, git_dates=git_dates
+    )
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(analyse_one, md_files))
+
+    for info, targets in results:
+        linked_targets |= targets
         file_infos.append(info)
         total_lines += info.line_count
         todo_count += info.todo_count
@@ -347,7 +532,7 @@ def analyse(root: Path) -> HealthMetrics:
             stale_files.append(info.path)
 
     # Orphan detection.
-    orphaned = _find_orphans(md_files, root)
+    orphaned = _find_orphans((info.path for info in file_infos), linked_targets)
 
     total_files = len(file_infos)
     avg_lines = round(total_lines / total_files, 1) if total_files > 0 else 0.0
@@ -396,131 +581,140 @@ def _score_label(score: int) -> str:
     return "Critical"
 
 
-def generate_markdown(metrics: HealthMetrics) -> str:  # noqa: C901
-    """Generate a Markdown health dashboard report."""
-    lines: list[str] = []
+# Static report sections, each written with a single call.
+_SCORE_BREAKDOWN = """\
+### Score Breakdown
 
-    lines.append("# Documentation Health Dashboard")
-    lines.append("")
-    lines.append("> Auto-generated documentation health report. Do not edit manually.")
-    lines.append(f"> Last updated: {metrics.scan_time}")
-    lines.append("")
+| Component | Weight | Description |
+|-----------|--------|-------------|
+| Orphan ratio | 30 pts | Fewer orphaned files is better |
+| Heading coverage | 25 pts | All files should have at least one heading |
+| Freshness | 20 pts | Files updated within the last 90 days |
+| TODO density | 15 pts | Lower density of TODO/FIXME markers |
+| Average size | 10 pts | Files averaging at least 20 lines |
+
+"""
+
+_TREND_HEADER = """\
+## Trend
+
+<!-- Trend data will be appended by CI when historical snapshots are available. -->
+
+| Date | Score | Files | Orphans | Stale |
+|------|-------|-------|---------|-------|
+"""
+
+_FOOTER = """\
+---
+
+*This file is auto-generated. Do not edit manually.*
+"""
+
+
+def _write_priority_section(
+    write: Callable[[str], int],
+    title: str,
+    intro: str,
+    files: Sequence[str],
+    limit: int,
+) -> None:
+    """Write one "Top Priorities" subsection listing up to *limit* files."""
+    write(f"### {title}\n\n{intro}\n\n")
+    for f in heapq.nsmallest(limit, files):
+        write(f"- `{f}`\n")
+    if len(files) > limit:
+        write(f"- ... and {len(files) - limit} more\n")
+    write("\n")
+
+
+def generate_markdown(metrics: HealthMetrics) -> str:
+    """Generate a Markdown health dashboard report."""
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        "# Documentation Health Dashboard\n"
+        "\n"
+        "> Auto-generated documentation health report. Do not edit manually.\n"
+        f"> Last updated: {metrics.scan_time}\n"
+        "\n"
+    )
 
     # Overall score
-    lines.append("## Overall Health Score")
-    lines.append("")
-    lines.append("```")
-    lines.append(f"  {_ascii_bar(metrics.health_score)}")
-    lines.append(f"  Rating: {_score_label(metrics.health_score)}")
-    lines.append("```")
-    lines.append("")
+    w(
+        "## Overall Health Score\n"
+        "\n"
+        "```\n"
+        f"  {_ascii_bar(metrics.health_score)}\n"
+        f"  Rating: {_score_label(metrics.health_score)}\n"
+        "```\n"
+        "\n"
+    )
 
     # Summary table
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("| Metric | Value |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Total documentation files | {metrics.total_files} |")
-    lines.append(f"| Total lines | {metrics.total_lines:,} |")
-    lines.append(f"| Average file size (lines) | {metrics.average_lines} |")
-    lines.append(f"| Orphaned files | {metrics.orphaned_count} |")
-    lines.append(f"| Files without headings | {metrics.no_heading_count} |")
-    lines.append(
-        f"| Stale files (>{STALE_THRESHOLD_DAYS} days) | {metrics.stale_count} |"
+    w(
+        "## Summary\n"
+        "\n"
+        "| Metric | Value |\n"
+        "|--------|-------|\n"
+        f"| Total documentation files | {metrics.total_files} |\n"
+        f"| Total lines | {metrics.total_lines:,} |\n"
+        f"| Average file size (lines) | {metrics.average_lines} |\n"
+        f"| Orphaned files | {metrics.orphaned_count} |\n"
+        f"| Files without headings | {metrics.no_heading_count} |\n"
+        f"| Stale files (>{STALE_THRESHOLD_DAYS} days) | {metrics.stale_count} |\n"
+        f"| TODO/FIXME markers | {metrics.todo_count} |\n"
+        f"| **Health score** | **{metrics.health_score}/100** |\n"
+        "\n"
     )
-    lines.append(f"| TODO/FIXME markers | {metrics.todo_count} |")
-    lines.append(f"| **Health score** | **{metrics.health_score}/100** |")
-    lines.append("")
-
-    # Score breakdown
-    lines.append("### Score Breakdown")
-    lines.append("")
-    lines.append("| Component | Weight | Description |")
-    lines.append("|-----------|--------|-------------|")
-    lines.append("| Orphan ratio | 30 pts | Fewer orphaned files is better |")
-    lines.append("| Heading coverage | 25 pts | All files should have at least one heading |")
-    lines.append("| Freshness | 20 pts | Files updated within the last 90 days |")
-    lines.append("| TODO density | 15 pts | Lower density of TODO/FIXME markers |")
-    lines.append("| Average size | 10 pts | Files averaging at least 20 lines |")
-    lines.append("")
 
-    # Top priorities
-    lines.append("## Top Priorities for Improvement")
-    lines.append("")
+    w(_SCORE_BREAKDOWN)
 
-    has_priorities = False
+    # Top priorities
+    w("## Top Priorities for Improvement\n\n")
 
     if metrics.no_heading_files:
-        has_priorities = True
-        lines.append("### Files Without Headings")
-        lines.append("")
-        lines.append(
-            "These files lack a Markdown heading, making them harder to navigate:"
+        _write_priority_section(
+            w,
+            "Files Without Headings",
+            "These files lack a Markdown heading, making them harder to navigate:",
+            metrics.no_heading_files,
+            15,
         )
-        lines.append("")
-        for f in sorted(metrics.no_heading_files)[:15]:
-            lines.append(f"- `{f}`")
-        if len(metrics.no_heading_files) > 15:
-            remaining = len(metrics.no_heading_files) - 15
-            lines.append(f"- ... and {remaining} more")
-        lines.append("")
 
     if metrics.orphaned_files:
-        has_priorities = True
-        lines.append("### Orphaned Documentation")
-        lines.append("")
-        lines.append(
-            "These files are not linked from any other Markdown file in the repository:"
+        _write_priority_section(
+            w,
+            "Orphaned Documentation",
+            "These files are not linked from any other Markdown file in the repository:",
+            metrics.orphaned_files,
+            20,
         )
-        lines.append("")
-        for f in sorted(metrics.orphaned_files)[:20]:
-            lines.append(f"- `{f}`")
-        if len(metrics.orphaned_files) > 20:
-            remaining = len(metrics.orphaned_files) - 20
-            lines.append(f"- ... and {remaining} more")
-        lines.append("")
 
     if metrics.stale_files:
-        has_priorities = True
-        lines.append("### Stale Documentation")
-        lines.append("")
-        lines.append(
-            f"These files have not been updated in over {STALE_THRESHOLD_DAYS} days:"
+        _write_priority_section(
+            w,
+            "Stale Documentation",
+            f"These files have not been updated in over {STALE_THRESHOLD_DAYS} days:",
+            metrics.stale_files,
+            20,
         )
-        lines.append("")
-        for f in sorted(metrics.stale_files)[:20]:
-            lines.append(f"- `{f}`")
-        if len(metrics.stale_files) > 20:
-            remaining = len(metrics.stale_files) - 20
-            lines.append(f"- ... and {remaining} more")
-        lines.append("")
-
-    if not has_priorities:
-        lines.append("No immediate issues found. Documentation is in good shape!")
-        lines.append("")
+
+    if not (
+        metrics.no_heading_files or metrics.orphaned_files or metrics.stale_files
+    ):
+        w("No immediate issues found. Documentation is in good shape!\n\n")
 
     # Trend placeholder
-    lines.append("## Trend")
-    lines.append("")
-    lines.append(
-        "<!-- Trend data will be appended by CI when historical snapshots are available. -->"
-    )
-    lines.append("")
-    lines.append("| Date | Score | Files | Orphans | Stale |")
-    lines.append("|------|-------|-------|---------|-------|")
-    lines.append(
+    w(_TREND_HEADER)
+    w(
         f"| {metrics.scan_time[:10]} | {metrics.health_score} "
-        f"| {metrics.total_files} | {metrics.orphaned_count} | {metrics.stale_count} |"
+        f"| {metrics.total_files} | {metrics.orphaned_count} | {metrics.stale_count} |\n"
+        "\n"
     )
-    lines.append("")
-
-    # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append("*This file is auto-generated. Do not edit manually.*")
-    lines.append("")
 
-    return "\n".join(lines)
+    w(_FOOTER)
+    return buf.getvalue()
 
 
 def generate_summary(metrics: HealthMetrics) -> str:
@@ -536,6 +730,21 @@ def generate_summary(metrics: HealthMetrics) -> str:
     )
 
 
+def _write_json(path: Path, data: dict) -> None:
+    """Write *data* to *path* as two-space indented JSON.
+
+    Uses orjson when installed; otherwise ``json.dump`` streams the encoding
+    into the file rather than building the whole document as one string.
+    """
+    if _ORJSON is not None:
+        path.write_bytes(
+            _ORJSON.dumps(data, default=str, option=_ORJSON.OPT_INDENT_2)
+        )
+        return
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, default=str)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -618,10 +827,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:  # noqa: C901
     if args.json_output is not None:
         try:
             args.json_output.parent.mkdir(parents=True, exist_ok=True)
-            args.json_output.write_text(
-                json.dumps(metrics.to_dict(), indent=2, default=str),
-                encoding="utf-8",
-            )
+            _write_json(args.json_output, metrics.to_dict())
             print(f"JSON metrics written to {args.json_output}")
         except OSError as exc:
             print(f"Error writing JSON output: {exc}", file=sys.stderr)
@@ -17,19 +17,52 @@ Usage:
     python3 generate-metrics-dashboard.py --output docs/status/metrics-dashboard.md
     python3 generate-metrics-dashboard.py --json-output metrics.json --days 30
     python3 generate-metrics-dashboard.py --summary
+    python3 generate-metrics-dashboard.py --summary --cache .cache/metrics
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import io
 import json
+import mmap
+import os
+import re
+import subprocess
 import sys
-from dataclasses import asdict, dataclass, field
+import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional, TextIO
 
 
+def _try_import_orjson() -> Any:
+    """Attempt to import orjson; return the module or None."""
+    try:
+        import orjson  # type: ignore[import-not-found]
+        return orjson
+    except ImportError:
+        return None
+
+
+_ORJSON = _try_import_orjson()
+
+
+def _try_import_numpy() -> Any:
+    """Attempt to import numpy; return the module or None."""
+    try:
+        import numpy  # type: ignore[import-not-found]
+        return numpy
+    except ImportError:
+        return None
+
+
+_NUMPY = _try_import_numpy()
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -40,6 +73,22 @@ EXCLUDE_DIRS: frozenset[str] = frozenset({
 
 DEFAULT_LOOKBACK_DAYS = 30
 
+# Cached dashboards older than this are rebuilt even when their key matches,
+# since the lookback window moves with the clock.
+CACHE_MAX_AGE_SECONDS = 3600
+
+# The start tag of one test result in a Visual Studio .trx file.  Bytes
+# patterns, so results are matched over the mapped file undecoded.
+_TRX_RESULT_PATTERN = re.compile(rb'<UnitTestResult\b[^>]*>')
+
+# Attributes read from a result's start tag, in whatever order they appear.
+# The TRX logger omits ``duration`` when it is zero, e.g. for skipped tests.
+_TRX_OUTCOME_PATTERN = re.compile(rb'\soutcome="([^"]*)"')
+_TRX_DURATION_PATTERN = re.compile(rb'\sduration="([^"]+)"')
+
+# .trx outcomes counted as failures; anything else but "Passed" is skipped.
+_TRX_FAILED_OUTCOMES = frozenset({b'Failed', b'Error', b'Timeout', b'Aborted'})
+
 # Known workflow files to track
 WORKFLOW_FILES = {
     'test-matrix.yml': 'Test Matrix',
@@ -56,7 +105,7 @@ WORKFLOW_FILES = {
 # Data Models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowRun:
     """Represents a single workflow run."""
     name: str
@@ -65,8 +114,23 @@ class WorkflowRun:
     timestamp: datetime
     commit_sha: str = ""
 
+    def to_json_dict(self) -> dict:
+        """Convert to a JSON-ready dictionary with an ISO-8601 timestamp."""
+        return {
+            'name': self.name,
+            'status': self.status,
+            'duration_seconds': self.duration_seconds,
+            'timestamp': self.timestamp.isoformat(),
+            'commit_sha': self.commit_sha,
+        }
 
-@dataclass
+    @classmethod
+    def from_json_dict(cls, data: dict) -> WorkflowRun:
+        """Rebuild a run from ``to_json_dict`` output."""
+        return cls(**{**data, 'timestamp': datetime.fromisoformat(data['timestamp'])})
+
+
+@dataclass(slots=True)
 class WorkflowMetrics:
     """Aggregated metrics for a workflow."""
     name: str
@@ -87,8 +151,29 @@ class WorkflowMetrics:
             return 0.0
         return (self.failure_count / self.total_runs) * 100
 
+    def to_json_dict(self) -> dict:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'name': self.name,
+            'total_runs': self.total_runs,
+            'success_count': self.success_count,
+            'failure_count': self.failure_count,
+            'cancelled_count': self.cancelled_count,
+            'avg_duration_seconds': self.avg_duration_seconds,
+            'min_duration_seconds': self.min_duration_seconds,
+            'max_duration_seconds': self.max_duration_seconds,
+            'success_rate': self.success_rate,
+            'runs': [run.to_json_dict() for run in self.runs],
+        }
 
-@dataclass
+    @classmethod
+    def from_json_dict(cls, data: dict) -> WorkflowMetrics:
+        """Rebuild workflow metrics from ``to_json_dict`` output."""
+        runs = [WorkflowRun.from_json_dict(run) for run in data['runs']]
+        return cls(**{**data, 'runs': runs})
+
+
+@dataclass(slots=True)
 class TestMetrics:
     """Test execution metrics."""
     total_tests: int = 0
@@ -98,8 +183,24 @@ class TestMetrics:
     avg_duration_ms: float = 0.0
     pass_rate: float = 0.0
 
+    def to_json_dict(self) -> dict:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'total_tests': self.total_tests,
+            'passed_tests': self.passed_tests,
+            'failed_tests': self.failed_tests,
+            'skipped_tests': self.skipped_tests,
+            'avg_duration_ms': self.avg_duration_ms,
+            'pass_rate': self.pass_rate,
+        }
+
+    @classmethod
+    def from_json_dict(cls, data: dict) -> TestMetrics:
+        """Rebuild test metrics from ``to_json_dict`` output."""
+        return cls(**data)
 
-@dataclass
+
+@dataclass(slots=True)
 class BuildMetrics:
     """Build execution metrics."""
     total_builds: int = 0
@@ -108,8 +209,23 @@ class BuildMetrics:
     avg_build_time_seconds: float = 0.0
     success_rate: float = 0.0
 
+    def to_json_dict(self) -> dict:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'total_builds': self.total_builds,
+            'successful_builds': self.successful_builds,
+            'failed_builds': self.failed_builds,
+            'avg_build_time_seconds': self.avg_build_time_seconds,
+            'success_rate': self.success_rate,
+        }
+
+    @classmethod
+    def from_json_dict(cls, data: dict) -> BuildMetrics:
+        """Rebuild build metrics from ``to_json_dict`` output."""
+        return cls(**data)
 
-@dataclass
+
+@dataclass(slots=True)
 class MetricsDashboard:
     """Complete metrics dashboard."""
     workflows: dict[str, WorkflowMetrics] = field(default_factory=dict)
@@ -119,23 +235,76 @@ class MetricsDashboard:
     lookback_days: int = 30
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+
+        Built from each model's ``to_json_dict`` rather than ``asdict``,
+        which deep-copies every run; timestamps are already ISO strings.
+        """
         return {
-            'workflows': {k: asdict(v) for k, v in self.workflows.items()},
-            'tests': asdict(self.tests),
-            'builds': asdict(self.builds),
+            'workflows': {k: v.to_json_dict() for k, v in self.workflows.items()},
+            'tests': self.tests.to_json_dict(),
+            'builds': self.builds.to_json_dict(),
             'generated_at': self.generated_at,
             'lookback_days': self.lookback_days,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> MetricsDashboard:
+        """Rebuild a dashboard from ``to_dict`` output."""
+        return cls(
+            workflows={
+                k: WorkflowMetrics.from_json_dict(v) for k, v in data['workflows'].items()
+            },
+            tests=TestMetrics.from_json_dict(data['tests']),
+            builds=BuildMetrics.from_json_dict(data['builds']),
+            generated_at=data['generated_at'],
+            lookback_days=data['lookback_days'],
+        )
+
 
 # ---------------------------------------------------------------------------
 # Analysis Functions
 # ---------------------------------------------------------------------------
 
-def _should_skip(path: Path) -> bool:
-    """Check if path should be skipped."""
-    return any(part in EXCLUDE_DIRS for part in path.parts)
+def _iter_files(root: str, suffix: str) -> Iterator[os.DirEntry[str]]:
+    """Yield the file entries under *root* whose names end with *suffix*.
+
+    ``EXCLUDE_DIRS`` are pruned before descent and symlinked directories are
+    not followed; file types come from the directory read, with no extra
+    ``stat`` per entry.
+    """
+    pending: list[str] = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in EXCLUDE_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as exc:
+            print(f"Warning: could not scan {directory}: {exc}", file=sys.stderr)
+
+
+def _scan_mapped(path: str, pattern: re.Pattern[bytes]) -> list[Any]:
+    """Return ``pattern.findall`` over the memory-mapped file at *path*.
+
+    The kernel pages the file in on demand and nothing is decoded; only the
+    matches are copied out.  Empty files yield no matches.
+    """
+    with open(path, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pattern.findall(mm)
+
+
+def _trx_duration_ms(value: bytes) -> float:
+    """Convert a TRX ``hh:mm:ss.fffffff`` duration to milliseconds."""
+    hours, minutes, seconds = value.split(b':')
+    return (int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1000
 
 
 def _parse_test_results(root: Path, lookback_days: int) -> TestMetrics:
@@ -148,8 +317,35 @@ def _parse_test_results(root: Path, lookback_days: int) -> TestMetrics:
     if not test_results_dir.exists():
         return metrics
 
-    # In a real implementation, parse .trx files or test output
-    # For now, return empty metrics
+    # Count every <UnitTestResult> in the .trx files written within the
+    # lookback window.
+    cutoff = datetime.now(timezone.utc).timestamp() - lookback_days * 86400
+    total_duration_ms = 0.0
+    for entry in _iter_files(str(test_results_dir), '.trx'):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                continue
+            results = _scan_mapped(entry.path, _TRX_RESULT_PATTERN)
+        except OSError as exc:
+            print(f"Warning: could not read {entry.path}: {exc}", file=sys.stderr)
+            continue
+        for tag in results:
+            outcome_match = _TRX_OUTCOME_PATTERN.search(tag)
+            outcome = outcome_match.group(1) if outcome_match else b''
+            duration = _TRX_DURATION_PATTERN.search(tag)
+            metrics.total_tests += 1
+            if duration:
+                total_duration_ms += _trx_duration_ms(duration.group(1))
+            if outcome == b'Passed':
+                metrics.passed_tests += 1
+            elif outcome in _TRX_FAILED_OUTCOMES:
+                metrics.failed_tests += 1
+            else:
+                metrics.skipped_tests += 1
+
+    if metrics.total_tests:
+        metrics.avg_duration_ms = total_duration_ms / metrics.total_tests
+        metrics.pass_rate = metrics.passed_tests / metrics.total_tests * 100
     return metrics
 
 
@@ -206,6 +402,9 @@ def _ascii_chart(values: list[float], width: int = 40, height: int = 10) -> str:
     if not values:
         return ""
 
+    if _NUMPY is not None:
+        return _ascii_chart_numpy(values, height)
+
     min_val = min(values)
     max_val = max(values)
     range_val = max_val - min_val if max_val > min_val else 1
@@ -213,147 +412,177 @@ def _ascii_chart(values: list[float], width: int = 40, height: int = 10) -> str:
     # Normalize values to chart height
     normalized = [int((v - min_val) / range_val * (height - 1)) for v in values]
 
-    lines = []
-    for h in range(height - 1, -1, -1):
-        line = ""
-        for val in normalized:
-            if val >= h:
-                line += "█"
-            else:
-                line += " "
-        lines.append(line)
+    return "\n".join(
+        "".join(["█" if val >= h else " " for val in normalized])
+        for h in range(height - 1, -1, -1)
+    )
 
-    return "\n".join(lines)
+
+def _ascii_chart_numpy(values: list[float], height: int) -> str:
+    """Vectorised ``_ascii_chart`` body: one boolean grid instead of a cell loop."""
+    np = _NUMPY
+    arr = np.asarray(values, dtype=np.float64)
+    min_val = arr.min()
+    max_val = arr.max()
+    range_val = max_val - min_val if max_val > min_val else 1.0
+
+    normalized = ((arr - min_val) / range_val * (height - 1)).astype(np.int64)
+    filled = normalized >= np.arange(height - 1, -1, -1)[:, None]
+
+    # Each row of one-character cells is reinterpreted as a single string.
+    rows = np.where(filled, "█", " ").view(f"U{arr.size}")[:, 0]
+    return "\n".join(rows.tolist())
+
+
+# Lower bounds of the Fair, Good and Excellent badges; anything below the
+# first is Poor.
+_BADGE_THRESHOLDS: tuple[float, ...] = (70, 85, 95)
+_BADGES: tuple[str, ...] = ("🔴 Poor", "🟠 Fair", "🟡 Good", "🟢 Excellent")
 
 
 def _status_badge(rate: float) -> str:
     """Generate status badge based on rate."""
-    if rate >= 95:
-        return "🟢 Excellent"
-    elif rate >= 85:
-        return "🟡 Good"
-    elif rate >= 70:
-        return "🟠 Fair"
-    else:
-        return "🔴 Poor"
+    return _BADGES[bisect_right(_BADGE_THRESHOLDS, rate)]
+
+
+def _fmt_rate(rate: float) -> str:
+    """Format *rate* as a one-decimal percentage followed by its badge."""
+    return f"{rate:.1f}% {_BADGES[bisect_right(_BADGE_THRESHOLDS, rate)]}"
 
 
 def generate_markdown(dashboard: MetricsDashboard) -> str:
     """Generate Markdown metrics dashboard."""
-    lines = []
-
-    lines.append("# Build Metrics Dashboard")
-    lines.append("")
-    lines.append("> Auto-generated build and test metrics. Do not edit manually.")
-    lines.append(f"> Generated: {dashboard.generated_at}")
-    lines.append(f"> Data period: Last {dashboard.lookback_days} days")
-    lines.append("")
+    buf = io.StringIO()
+    write_markdown(dashboard, buf)
+    return buf.getvalue()
+
+
+def write_markdown(dashboard: MetricsDashboard, out: TextIO) -> None:
+    """Write the Markdown metrics dashboard to *out* section by section."""
+    w = out.write
+
+    w(
+        "# Build Metrics Dashboard\n"
+        "\n"
+        "> Auto-generated build and test metrics. Do not edit manually.\n"
+        f"> Generated: {dashboard.generated_at}\n"
+        f"> Data period: Last {dashboard.lookback_days} days\n"
+        "\n"
+    )
 
     # Overall Summary
-    lines.append("## Summary")
-    lines.append("")
-
-    total_workflow_runs = sum(w.total_runs for w in dashboard.workflows.values())
+    total_workflow_runs = sum(wf.total_runs for wf in dashboard.workflows.values())
     avg_success_rate = (
-        sum(w.success_rate for w in dashboard.workflows.values()) / len(dashboard.workflows)
+        sum(wf.success_rate for wf in dashboard.workflows.values()) / len(dashboard.workflows)
         if dashboard.workflows else 0.0
     )
 
-    lines.append("| Metric | Value |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Total Workflow Runs | {total_workflow_runs} |")
-    lines.append(f"| Average Success Rate | {avg_success_rate:.1f}% {_status_badge(avg_success_rate)} |")
-    lines.append(f"| Total Tests Executed | {dashboard.tests.total_tests} |")
-    lines.append(f"| Test Pass Rate | {dashboard.tests.pass_rate:.1f}% |")
-    lines.append(f"| Total Builds | {dashboard.builds.total_builds} |")
-    lines.append(f"| Build Success Rate | {dashboard.builds.success_rate:.1f}% |")
-    lines.append("")
+    w(
+        "## Summary\n"
+        "\n"
+        "| Metric | Value |\n"
+        "|--------|-------|\n"
+        f"| Total Workflow Runs | {total_workflow_runs} |\n"
+        f"| Average Success Rate | {_fmt_rate(avg_success_rate)} |\n"
+        f"| Total Tests Executed | {dashboard.tests.total_tests} |\n"
+        f"| Test Pass Rate | {dashboard.tests.pass_rate:.1f}% |\n"
+        f"| Total Builds | {dashboard.builds.total_builds} |\n"
+        f"| Build Success Rate | {dashboard.builds.success_rate:.1f}% |\n"
+        "\n"
+    )
 
     # Workflow Metrics
     if dashboard.workflows:
-        lines.append("## Workflow Metrics")
-        lines.append("")
-        lines.append("| Workflow | Runs | Success Rate | Avg Duration | Status |")
-        lines.append("|----------|------|--------------|--------------|--------|")
+        w(
+            "## Workflow Metrics\n"
+            "\n"
+            "| Workflow | Runs | Success Rate | Avg Duration | Status |\n"
+            "|----------|------|--------------|--------------|--------|\n"
+        )
 
-        for name, metrics in sorted(dashboard.workflows.items()):
+        # Workflows are listed in WORKFLOW_FILES order, in which they are added.
+        for name, metrics in dashboard.workflows.items():
             avg_dur = f"{metrics.avg_duration_seconds:.1f}s" if metrics.avg_duration_seconds > 0 else "N/A"
             status = _status_badge(metrics.success_rate)
-            lines.append(
+            w(
                 f"| {name} | {metrics.total_runs} | {metrics.success_rate:.1f}% | "
-                f"{avg_dur} | {status} |"
+                f"{avg_dur} | {status} |\n"
             )
-        lines.append("")
+        w("\n")
 
     # Test Metrics
-    lines.append("## Test Metrics")
-    lines.append("")
-    lines.append("| Metric | Value |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Total Tests | {dashboard.tests.total_tests} |")
-    lines.append(f"| Passed | {dashboard.tests.passed_tests} |")
-    lines.append(f"| Failed | {dashboard.tests.failed_tests} |")
-    lines.append(f"| Skipped | {dashboard.tests.skipped_tests} |")
-    lines.append(f"| Pass Rate | {dashboard.tests.pass_rate:.1f}% {_status_badge(dashboard.tests.pass_rate)} |")
+    w(
+        "## Test Metrics\n"
+        "\n"
+        "| Metric | Value |\n"
+        "|--------|-------|\n"
+        f"| Total Tests | {dashboard.tests.total_tests} |\n"
+        f"| Passed | {dashboard.tests.passed_tests} |\n"
+        f"| Failed | {dashboard.tests.failed_tests} |\n"
+        f"| Skipped | {dashboard.tests.skipped_tests} |\n"
+        f"| Pass Rate | {_fmt_rate(dashboard.tests.pass_rate)} |\n"
+    )
 
     if dashboard.tests.avg_duration_ms > 0:
-        lines.append(f"| Avg Duration | {dashboard.tests.avg_duration_ms:.0f}ms |")
-    lines.append("")
+        w(f"| Avg Duration | {dashboard.tests.avg_duration_ms:.0f}ms |\n")
+    w("\n")
 
     # Build Metrics
-    lines.append("## Build Metrics")
-    lines.append("")
-    lines.append("| Metric | Value |")
-    lines.append("|--------|-------|")
-    lines.append(f"| Total Builds | {dashboard.builds.total_builds} |")
-    lines.append(f"| Successful | {dashboard.builds.successful_builds} |")
-    lines.append(f"| Failed | {dashboard.builds.failed_builds} |")
-    lines.append(f"| Success Rate | {dashboard.builds.success_rate:.1f}% {_status_badge(dashboard.builds.success_rate)} |")
+    w(
+        "## Build Metrics\n"
+        "\n"
+        "| Metric | Value |\n"
+        "|--------|-------|\n"
+        f"| Total Builds | {dashboard.builds.total_builds} |\n"
+        f"| Successful | {dashboard.builds.successful_builds} |\n"
+        f"| Failed | {dashboard.builds.failed_builds} |\n"
+        f"| Success Rate | {_fmt_rate(dashboard.builds.success_rate)} |\n"
+    )
 
     if dashboard.builds.avg_build_time_seconds > 0:
-        lines.append(f"| Avg Build Time | {dashboard.builds.avg_build_time_seconds:.1f}s |")
-    lines.append("")
+        w(f"| Avg Build Time | {dashboard.builds.avg_build_time_seconds:.1f}s |\n")
+    w("\n")
 
     # Trends
-    lines.append("## Trends")
-    lines.append("")
-    lines.append("*Historical trend analysis will be available after multiple runs.*")
-    lines.append("")
+    w(
+        "## Trends\n"
+        "\n"
+        "*Historical trend analysis will be available after multiple runs.*\n"
+        "\n"
+    )
 
     # Recommendations
-    lines.append("## Recommendations")
-    lines.append("")
+    w("## Recommendations\n\n")
 
     has_recommendations = False
 
     for name, metrics in dashboard.workflows.items():
         if metrics.success_rate < 85:
             has_recommendations = True
-            lines.append(f"- **{name}**: Success rate is {metrics.success_rate:.1f}%. "
-                         "Review recent failures and improve test stability.")
+            w(f"- **{name}**: Success rate is {metrics.success_rate:.1f}%. "
+              "Review recent failures and improve test stability.\n")
 
     if dashboard.tests.pass_rate < 95:
         has_recommendations = True
-        lines.append(f"- **Tests**: Pass rate is {dashboard.tests.pass_rate:.1f}%. "
-                     "Address failing tests to improve reliability.")
+        w(f"- **Tests**: Pass rate is {dashboard.tests.pass_rate:.1f}%. "
+          "Address failing tests to improve reliability.\n")
 
     if dashboard.builds.success_rate < 90:
         has_recommendations = True
-        lines.append(f"- **Builds**: Success rate is {dashboard.builds.success_rate:.1f}%. "
-                     "Investigate build failures and improve stability.")
+        w(f"- **Builds**: Success rate is {dashboard.builds.success_rate:.1f}%. "
+          "Investigate build failures and improve stability.\n")
 
     if not has_recommendations:
-        lines.append("All metrics are within acceptable ranges. Keep up the good work!")
+        w("All metrics are within acceptable ranges. Keep up the good work!\n")
 
-    lines.append("")
+    w("\n")
 
     # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append("*This dashboard is auto-generated. For detailed logs, check GitHub Actions.*")
-    lines.append("")
-
-    return "\n".join(lines)
+    w(
+        "---\n"
+        "\n"
+        "*This dashboard is auto-generated. For detailed logs, check GitHub Actions.*\n"
+    )
 
 
 def generate_summary(dashboard: MetricsDashboard) -> str:
@@ -367,7 +596,7 @@ def generate_summary(dashboard: MetricsDashboard) -> str:
     return (
         f"### Build Metrics ({dashboard.lookback_days}d)\n\n"
         f"- **Workflow Runs**: {total_runs}\n"
-        f"- **Success Rate**: {avg_success:.1f}% {_status_badge(avg_success)}\n"
+        f"- **Success Rate**: {_fmt_rate(avg_success)}\n"
         f"- **Tests**: {dashboard.tests.total_tests} ({dashboard.tests.pass_rate:.1f}% pass)\n"
         f"- **Builds**: {dashboard.builds.total_builds} ({dashboard.builds.success_rate:.1f}% success)\n"
     )
@@ -384,14 +613,100 @@ def build_dashboard(root: Path, lookback_days: int) -> MetricsDashboard:
         lookback_days=lookback_days,
     )
 
-    # Gather metrics
-    dashboard.workflows = _parse_workflow_history(root, lookback_days)
-    dashboard.tests = _parse_test_results(root, lookback_days)
-    dashboard.builds = _parse_build_metrics(root, lookback_days)
+    # Gather metrics. The sources are independent and I/O-bound (file
+    # walks, reads, git), so they are gathered concurrently.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        workflows = executor.submit(_parse_workflow_history, root, lookback_days)
+        tests = executor.submit(_parse_test_results, root, lookback_days)
+        builds = executor.submit(_parse_build_metrics, root, lookback_days)
+        dashboard.workflows = workflows.result()
+        dashboard.tests = tests.result()
+        dashboard.builds = builds.result()
 
     return dashboard
 
 
+def _write_json(path: Path, data: dict) -> None:
+    """Write *data* to *path* as two-space indented JSON, using orjson when installed."""
+    if _ORJSON is not None:
+        path.write_bytes(_ORJSON.dumps(data, option=_ORJSON.OPT_INDENT_2))
+        return
+    path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON *data* with orjson when installed, else the stdlib parser.
+
+    Raises:
+        ValueError: If *data* is not valid JSON (both parsers' decode errors
+            subclass it).
+    """
+    if _ORJSON is not None:
+        return _ORJSON.loads(data)
+    return json.loads(data)
+
+
+def _dashboard_cache_key(root: Path, lookback_days: int) -> Optional[str]:
+    """Digest of the inputs ``build_dashboard`` reads, or None outside git.
+
+    The key covers the checked-out commit, the newest ``.trx`` file under
+    ``TestResults`` and the lookback window.
+    """
+    try:
+        head = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            text=True,
+            cwd=str(root),
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if head.returncode != 0:
+        return None
+
+    newest_trx = 0.0
+    test_results_dir = root / 'TestResults'
+    if test_results_dir.is_dir():
+        for entry in _iter_files(str(test_results_dir), '.trx'):
+            try:
+                newest_trx = max(newest_trx, entry.stat().st_mtime)
+            except OSError:
+                continue
+
+    material = f"{head.stdout.strip()}:{newest_trx}:{lookback_days}"
+    return hashlib.blake2b(material.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _build_dashboard_cached(
+    root: Path, lookback_days: int, cache_dir: Path
+) -> MetricsDashboard:
+    """``build_dashboard`` backed by an on-disk cache in *cache_dir*.
+
+    A fresh entry for the same key is loaded instead of re-parsing; a
+    missing, stale or unreadable entry is rebuilt and written back.  Cache
+    write failures only cost the next run a rebuild.
+    """
+    key = _dashboard_cache_key(root, lookback_days)
+    if key is None:
+        return build_dashboard(root, lookback_days)
+
+    cache_path = cache_dir / f"metrics-{key}.json"
+    try:
+        if time.time() - cache_path.stat().st_mtime <= CACHE_MAX_AGE_SECONDS:
+            return MetricsDashboard.from_dict(_json_loads(cache_path.read_bytes()))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    dashboard = build_dashboard(root, lookback_days)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(cache_path, dashboard.to_dict())
+    except OSError as exc:
+        print(f"Warning: Could not write dashboard cache {cache_path}: {exc}", file=sys.stderr)
+    return dashboard
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     """Entry point."""
     parser = argparse.ArgumentParser(
@@ -424,6 +739,12 @@ def main(argv: Optional[list[str]] = None) -> int:
         action='store_true',
         help='Print summary to stdout'
     )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        help='Reuse dashboards built for the same commit within the last hour '
+             'from this directory'
+    )
 
     args = parser.parse_args(argv)
 
@@ -433,25 +754,25 @@ def main(argv: Optional[list[str]] = None) -> int:
         return 1
 
     try:
-        dashboard = build_dashboard(root, args.days)
+        if args.cache:
+            dashboard = _build_dashboard_cached(root, args.days, args.cache)
+        else:
+            dashboard = build_dashboard(root, args.days)
     except Exception as exc:
         print(f"Error building dashboard: {exc}", file=sys.stderr)
         return 1
 
     # Write Markdown
     if args.output:
-        md = generate_markdown(dashboard)
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(md, encoding='utf-8')
+        with args.output.open('w', encoding='utf-8') as fh:
+            write_markdown(dashboard, fh)
         print(f"Metrics dashboard written to {args.output}")
 
     # Write JSON
     if args.json_output:
         args.json_output.parent.mkdir(parents=True, exist_ok=True)
-        args.json_output.write_text(
-            json.dumps(dashboard.to_dict(), indent=2, default=str),
-            encoding='utf-8'
-        )
+        _write_json(args.json_output, dashboard.to_dict())
         print(f"JSON metrics written to {args.json_output}")
 
     # Print summary
@@ -19,11 +19,14 @@ Environment:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import re
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -36,6 +39,11 @@ from typing import Any
 PROMPT_DIR = Path(".github/prompts")
 PROMPT_EXT = ".prompt.yml"
 MAX_LOG_LINES = 200  # max lines to extract per failed job
+MAX_FINDINGS_PER_CATEGORY = 10
+MAX_FAILED_TESTS = 20
+MAX_TEXT_CHARS = 2 * 1024 * 1024  # tail of log/annotation text to classify
+_LOG_READ_SIZE = 1 << 20  # pipe buffer for streamed job logs
+LOG_FETCH_WORKERS = 8  # concurrent `gh api` log downloads
 WORKFLOW_RESULTS_FILE = "workflow-run-results.json"
 
 # Categories that map workflow failure patterns to prompt topics
@@ -106,6 +114,57 @@ FAILURE_CATEGORIES = {
     },
 }
 
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+
+
+def _leading_literal(pattern: str) -> str:
+    """Return the lower-cased literal text every match of *pattern* starts with.
+
+    Stops at the first metacharacter or character class, and drops a final
+    character that a following quantifier could make optional.  Patterns
+    with a top-level alternation have no guaranteed prefix, so ``""`` is
+    returned for anything containing ``|``.
+    """
+    if "|" in pattern:
+        return ""
+    chars: list[str] = []
+    i = 1 if pattern.startswith("^") else 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            char = pattern[i + 1]
+            i += 2
+        elif char in _REGEX_SPECIAL:
+            break
+        else:
+            i += 1
+        if i < len(pattern) and pattern[i] in "*?{":
+            break
+        chars.append(char)
+    return "".join(chars).lower()
+
+
+# FAILURE_CATEGORIES patterns compiled once, in the same category/pattern order,
+# each paired with the literal prefix used to skip patterns that cannot match
+_COMPILED_CATEGORIES = {
+    category: [
+        (_leading_literal(pattern), re.compile(pattern, re.IGNORECASE))
+        for pattern in info["patterns"]
+    ]
+    for category, info in FAILURE_CATEGORIES.items()
+}
+
+_FAILED_TEST_PATTERNS = (
+    re.compile(r"\[\s*FAIL\s*\]\s*(.+)"),
+    re.compile(r"Failed\s+(\S+\.\S+)"),
+    re.compile(r"X\s+(\S+\.\S+)"),
+)
+_ERROR_CODE_PATTERN = re.compile(
+    r"(?:error|warning)\s+(CS\d{4}|NU\d{4}|CA\d{4}|SA\d{4}|IDE\d{4}|NETSDK\d{4})"
+)
+_PROMPT_NAME_PATTERN = re.compile(r"^name:\s*(.+)$", re.MULTILINE)
+_PROMPT_DESCRIPTION_PATTERN = re.compile(r"^description:\s*(.+)$", re.MULTILINE)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -135,8 +194,13 @@ def get_repo() -> str:
         return ""
 
 
-def gh_api(endpoint: str) -> dict | list | None:
-    """Call GitHub API via gh CLI."""
+@functools.lru_cache(maxsize=128)
+def _gh_api_text(endpoint: str) -> str | None:
+    """Return the raw gh CLI response for *endpoint*, or None on failure.
+
+    Cached for the lifetime of the process, failures included, so repeated
+    lookups of the same endpoint do not spawn ``gh`` again.
+    """
     try:
         result = subprocess.run(
             ["gh", "api", endpoint, "--paginate"],
@@ -144,8 +208,23 @@ def gh_api(endpoint: str) -> dict | list | None:
             text=True,
             check=True,
         )
-        return json.loads(result.stdout)
-    except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    return result.stdout
+
+
+def gh_api(endpoint: str) -> dict | list | None:
+    """Call GitHub API via gh CLI.
+
+    Responses are cached per endpoint as text and parsed on every call, so
+    callers always get objects they are free to modify.
+    """
+    text = _gh_api_text(endpoint)
+    if text is None:
+        return None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
         return None
 
 
@@ -170,20 +249,27 @@ def fetch_run_jobs(repo: str, run_id: int) -> list[dict[str, Any]]:
 
 
 def fetch_job_logs(repo: str, job_id: int) -> str:
-    """Fetch logs for a specific job (truncated)."""
+    """Fetch logs for a specific job (truncated).
+
+    The log is streamed and only its last ``MAX_LOG_LINES`` lines are kept,
+    so memory stays bounded however large the job output is.
+    """
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["gh", "api", f"repos/{repo}/actions/jobs/{job_id}/logs"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            check=False,
+            bufsize=_LOG_READ_SIZE,
         )
-        if result.returncode == 0:
-            lines = result.stdout.splitlines()
-            # Return last N lines for analysis
-            return "\n".join(lines[-MAX_LOG_LINES:])
     except FileNotFoundError:
-        pass
+        return ""
+    with proc:
+        tail = deque(proc.stdout, maxlen=MAX_LOG_LINES)
+    if proc.returncode == 0:
+        # Return last N lines for analysis; re-split so separators other
+        # than newline count as line breaks, as str.splitlines does
+        return "\n".join("".join(tail).splitlines()[-MAX_LOG_LINES:])
     return ""
 
 
@@ -191,17 +277,9 @@ def fetch_run_annotations(repo: str, run_id: int) -> list[dict[str, Any]]:
     """Fetch annotations (errors/warnings) for a workflow run."""
     # Annotations come from check runs; try to fetch via check-suite
     endpoint = f"repos/{repo}/actions/runs/{run_id}/annotations"
-    try:
-        result = subprocess.run(
-            ["gh", "api", endpoint, "--paginate"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-    except (FileNotFoundError, json.JSONDecodeError):
-        pass
+    data = gh_api(endpoint)
+    if isinstance(data, list):
+        return data
     return []
 
 
@@ -210,58 +288,91 @@ def fetch_run_annotations(repo: str, run_id: int) -> list[dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
+def _fold_case(text: str) -> str:
+    """Case-fold *text* so it contains every ``re.IGNORECASE`` literal match.
+
+    ``re`` also matches ``i`` against the dotted and dotless Turkish I,
+    which fold to something else, so both are mapped back to ``i``.
+    """
+    if text.isascii():
+        return text.lower()
+    return text.casefold().replace("i\u0307", "i").replace("\u0131", "i")
+
+
 def classify_failures(
     logs: str, annotations: list[dict[str, Any]]
 ) -> dict[str, list[str]]:
     """Classify failure patterns from logs and annotations."""
     findings: dict[str, list[str]] = {}
 
-    combined_text = logs
-    for ann in annotations:
-        msg = ann.get("message", "")
-        combined_text += f"\n{msg}"
-
-    for category, info in FAILURE_CATEGORIES.items():
-        matches = []
-        for pattern in info["patterns"]:
-            for match in re.finditer(pattern, combined_text, re.IGNORECASE):
+    parts = [logs]
+    parts.extend(str(ann.get("message", "")) for ann in annotations)
+    combined_text = "\n".join(parts)
+    if len(combined_text) > MAX_TEXT_CHARS:
+        # Root-cause lines cluster at the end; keep the tail from the first
+        # whole line so the scan cost stays bounded.
+        cut = len(combined_text) - MAX_TEXT_CHARS
+        newline = combined_text.find("\n", cut - 1)
+        combined_text = combined_text[newline + 1 if newline != -1 else cut :]
+
+    # A substring test on the case-folded text is far cheaper than a regex
+    # pass, so patterns whose literal prefix never occurs are skipped.
+    folded = _fold_case(combined_text)
+
+    for category, patterns in _COMPILED_CATEGORIES.items():
+        matches: list[str] = []
+        seen: set[str] = set()
+        for literal, pattern in patterns:
+            if len(matches) >= MAX_FINDINGS_PER_CATEGORY:
+                break
+            if literal not in folded:
+                continue
+            line_end = -1
+            for match in pattern.finditer(combined_text):
+                # Matches arrive in order, so one ending before line_end lies
+                # on a line that was already handled; skipping it keeps many
+                # matches on one long line linear instead of quadratic.
+                if match.end() <= line_end:
+                    continue
                 # Get surrounding context
                 start = max(0, combined_text.rfind("\n", 0, match.start()) + 1)
                 end = combined_text.find("\n", match.end())
                 if end == -1:
                     end = len(combined_text)
                 context_line = combined_text[start:end].strip()
-                if context_line and context_line not in matches:
+                # A match spanning a line break has a multi-line context that
+                # a later match on the second line would not share
+                line_end = -1 if "\n" in match.group() else end
+                if context_line and context_line not in seen:
+                    seen.add(context_line)
                     matches.append(context_line)
+                    if len(matches) >= MAX_FINDINGS_PER_CATEGORY:
+                        break
         if matches:
-            findings[category] = matches[:10]  # cap at 10 per category
+            findings[category] = matches
 
     return findings
 
 
 def extract_failed_tests(logs: str) -> list[str]:
     """Extract failed test names from log output."""
-    failed = []
-    patterns = [
-        r"\[\s*FAIL\s*\]\s*(.+)",
-        r"Failed\s+(\S+\.\S+)",
-        r"X\s+(\S+\.\S+)",
-    ]
-    for pattern in patterns:
-        for match in re.finditer(pattern, logs):
+    failed: list[str] = []
+    seen: set[str] = set()
+    for pattern in _FAILED_TEST_PATTERNS:
+        for match in pattern.finditer(logs):
             name = match.group(1).strip()
-            if name and name not in failed:
+            if name and name not in seen:
+                seen.add(name)
                 failed.append(name)
-    return failed[:20]
+                if len(failed) >= MAX_FAILED_TESTS:
+                    return failed
+    return failed
 
 
 def extract_error_codes(logs: str) -> list[str]:
     """Extract unique compiler/analyzer error codes."""
     codes = set()
-    for match in re.finditer(
-        r"(?:error|warning)\s+(CS\d{4}|NU\d{4}|CA\d{4}|SA\d{4}|IDE\d{4}|NETSDK\d{4})",
-        logs,
-    ):
+    for match in _ERROR_CODE_PATTERN.finditer(logs):
         codes.add(match.group(1))
     return sorted(codes)
 
@@ -280,8 +391,8 @@ def read_existing_prompts(prompt_dir: Path) -> list[dict[str, Any]]:
     for f in sorted(prompt_dir.glob(f"*{PROMPT_EXT}")):
         content = f.read_text(encoding="utf-8")
         # Simple YAML extraction (name and description)
-        name_match = re.search(r"^name:\s*(.+)$", content, re.MULTILINE)
-        desc_match = re.search(r"^description:\s*(.+)$", content, re.MULTILINE)
+        name_match = _PROMPT_NAME_PATTERN.search(content)
+        desc_match = _PROMPT_DESCRIPTION_PATTERN.search(content)
         prompts.append(
             {
                 "file": f.name,
@@ -298,48 +409,9 @@ def read_existing_prompts(prompt_dir: Path) -> list[dict[str, Any]]:
 # Prompt generation
 # ---------------------------------------------------------------------------
 
-
-def generate_prompt_yaml(
-    name: str,
-    description: str,
-    category: str,
-    findings: list[str],
-    failed_tests: list[str],
-    error_codes: list[str],
-    workflow_name: str,
-    run_url: str,
-) -> str:
-    """Generate a .prompt.yml file content for a failure category."""
-
-    # Build the error context section
-    error_context_lines = []
-    if error_codes:
-        error_context_lines.append("      ## Error Codes Found")
-        for code in error_codes[:15]:
-            error_context_lines.append(f"      - `{code}`")
-        error_context_lines.append("")
-
-    if findings:
-        error_context_lines.append("      ## Failure Patterns")
-        for finding in findings[:10]:
-            # Sanitize for YAML
-            safe = finding.replace("`", "'").replace('"', "'")
-            if len(safe) > 200:
-                safe = safe[:200] + "..."
-            error_context_lines.append(f"      - `{safe}`")
-        error_context_lines.append("")
-
-    if failed_tests:
-        error_context_lines.append("      ## Failed Tests")
-        for test in failed_tests[:10]:
-            error_context_lines.append(f"      - `{test}`")
-        error_context_lines.append("")
-
-    error_context = "\n".join(error_context_lines)
-
-    # Map category to expert context
-    category_context = {
-        "build": """\
+# Expert system context for each failure category
+_CATEGORY_SYSTEM_CONTENT = {
+    "build": """\
       You are a senior .NET developer troubleshooting build failures in a .NET 9.0 C#/F# project.
 
       ## Project Build Context
@@ -354,7 +426,7 @@ def generate_prompt_yaml(
       - NETSDK1100: Missing EnableWindowsTargeting
       - CS0246/CS0234: Missing using directive or assembly reference
       - CS8600-CS8604: Nullable reference type warnings treated as errors""",
-        "test": """\
+    "test": """\
       You are a senior .NET developer fixing test failures in a market data collection system.
 
       ## Test Framework
@@ -368,7 +440,7 @@ def generate_prompt_yaml(
       - Mock external dependencies (providers, storage)
       - Test edge cases: null inputs, empty collections, boundary values
       - Run tests: `dotnet test tests/Meridian.Tests`""",
-        "code-quality": """\
+    "code-quality": """\
       You are a senior .NET developer addressing code quality issues in a market data system.
 
       ## Quality Standards
@@ -377,7 +449,7 @@ def generate_prompt_yaml(
       - Structured logging with Serilog (no string interpolation)
       - Async/await for all I/O operations with CancellationToken
       - Classes sealed unless designed for inheritance""",
-        "security": """\
+    "security": """\
       You are a security engineer reviewing vulnerabilities in a .NET market data system.
 
       ## Security Requirements
@@ -386,7 +458,7 @@ def generate_prompt_yaml(
       - Validate all external inputs
       - Sanitize file paths to prevent traversal
       - Keep dependencies updated (Dependabot enabled)""",
-        "docker": """\
+    "docker": """\
       You are a DevOps engineer fixing Docker issues for a .NET market data system.
 
       ## Docker Context
@@ -394,7 +466,7 @@ def generate_prompt_yaml(
       - docker-compose at deploy/docker/docker-compose.yml
       - Multi-stage build with .NET 9.0 SDK and runtime images
       - Build: `docker build -f deploy/docker/Dockerfile .`""",
-        "performance": """\
+    "performance": """\
       You are a performance engineer addressing regressions in a high-throughput data pipeline.
 
       ## Performance Context
@@ -403,13 +475,9 @@ def generate_prompt_yaml(
       - Avoid allocations in hot paths
       - Use Span<T> and Memory<T> for buffer operations
       - Run benchmarks: `dotnet run --project benchmarks/Meridian.Benchmarks -c Release`""",
-    }
-
-    system_content = category_context.get(category, category_context["build"])
-
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+}
 
-    yaml = """name: {name}
+_PROMPT_TEMPLATE = """name: {name}
 description: {description}
 # Auto-generated prompt from workflow results - {workflow_name}
 # Generated: {now}
@@ -446,51 +514,9 @@ messages:
       2. Specific code fixes with file paths and line numbers
       3. Verification steps to confirm the fix
       4. Any preventive measures to avoid recurrence
-"""
-    return yaml
-
-
-def generate_workflow_summary_prompt(
-    workflow_name: str,
-    run_url: str,
-    all_findings: dict[str, list[str]],
-    all_failed_tests: list[str],
-    all_error_codes: list[str],
-    run_conclusion: str,
-) -> str:
-    """Generate a summary prompt for overall workflow results."""
-
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    findings_section = []
-    for cat, items in all_findings.items():
-        findings_section.append(f"      ### {cat.replace('-', ' ').title()}")
-        for item in items[:5]:
-            safe = item.replace("`", "'").replace('"', "'")
-            if len(safe) > 150:
-                safe = safe[:150] + "..."
-            findings_section.append(f"      - `{safe}`")
-        findings_section.append("")
-
-    findings_text = "\n".join(findings_section) if findings_section else "      No specific patterns detected."
-
-    test_section = ""
-    if all_failed_tests:
-        test_lines = "\n".join(f"      - `{t}`" for t in all_failed_tests[:15])
-        test_section = """
-      ## Failed Tests
-{test_lines}
 """
 
-    code_section = ""
-    if all_error_codes:
-        code_lines = "\n".join(f"      - `{c}`" for c in all_error_codes[:15])
-        code_section = """
-      ## Error Codes
-{code_lines}
-"""
-
-    yaml = """name: Workflow Results - {workflow_name}
+_SUMMARY_TEMPLATE = """name: Workflow Results - {workflow_name}
 description: Address issues found in the {workflow_name} workflow run
 # Auto-generated prompt from workflow run analysis
 # Generated: {now}
@@ -534,7 +560,106 @@ messages:
       3. Code changes needed (with file paths)
       4. Verification steps
 """
-    return yaml
+
+
+def generate_prompt_yaml(
+    name: str,
+    description: str,
+    category: str,
+    findings: list[str],
+    failed_tests: list[str],
+    error_codes: list[str],
+    workflow_name: str,
+    run_url: str,
+) -> str:
+    """Generate a .prompt.yml file content for a failure category."""
+
+    # Build the error context section
+    error_context_lines = []
+    if error_codes:
+        error_context_lines.append("      ## Error Codes Found")
+        for code in error_codes[:15]:
+            error_context_lines.append(f"      - `{code}`")
+        error_context_lines.append("")
+
+    if findings:
+        error_context_lines.append("      ## Failure Patterns")
+        for finding in findings[:10]:
+            # Sanitize for YAML
+            safe = finding.replace("`", "'").replace('"', "'")
+            if len(safe) > 200:
+                safe = safe[:200] + "..."
+            error_context_lines.append(f"      - `{safe}`")
+        error_context_lines.append("")
+
+    if failed_tests:
+        error_context_lines.append("      ## Failed Tests")
+        for test in failed_tests[:10]:
+            error_context_lines.append(f"      - `{test}`")
+        error_context_lines.append("")
+
+    error_context = "\n".join(error_context_lines)
+
+    system_content = _CATEGORY_SYSTEM_CONTENT.get(
+        category, _CATEGORY_SYSTEM_CONTENT["build"]
+    )
+
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    return _PROMPT_TEMPLATE.format(
+        name=name,
+        description=description,
+        workflow_name=workflow_name,
+        now=now,
+        run_url=run_url,
+        system_content=system_content,
+        error_context=error_context,
+    )
+
+
+def generate_workflow_summary_prompt(
+    workflow_name: str,
+    run_url: str,
+    all_findings: dict[str, list[str]],
+    all_failed_tests: list[str],
+    all_error_codes: list[str],
+    run_conclusion: str,
+) -> str:
+    """Generate a summary prompt for overall workflow results."""
+
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    findings_section = []
+    for cat, items in all_findings.items():
+        findings_section.append(f"      ### {cat.replace('-', ' ').title()}")
+        for item in items[:5]:
+            safe = item.replace("`", "'").replace('"', "'")
+            if len(safe) > 150:
+                safe = safe[:150] + "..."
+            findings_section.append(f"      - `{safe}`")
+        findings_section.append("")
+
+    findings_text = "\n".join(findings_section) if findings_section else "      No specific patterns detected."
+
+    test_section = ""
+    if all_failed_tests:
+        test_lines = "\n".join(f"      - `{t}`" for t in all_failed_tests[:15])
+        test_section = f"\n      ## Failed Tests\n{test_lines}\n"
+
+    code_section = ""
+    if all_error_codes:
+        code_lines = "\n".join(f"      - `{c}`" for c in all_error_codes[:15])
+        code_section = f"\n      ## Error Codes\n{code_lines}\n"
+
+    return _SUMMARY_TEMPLATE.format(
+        workflow_name=workflow_name,
+        now=now,
+        run_url=run_url,
+        run_conclusion=run_conclusion,
+        findings_text=findings_text,
+        test_section=test_section,
+        code_section=code_section,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -618,7 +743,7 @@ def main() -> int:  # noqa: C901
         run_url = f"https://github.com/{repo}/actions/runs/{run_id}"
 
     # --- Collect data ---
-    all_logs = ""
+    log_parts: list[str] = []
     all_annotations: list[dict[str, Any]] = []
     failed_job_names: list[str] = []
 
@@ -630,21 +755,30 @@ def main() -> int:  # noqa: C901
             # All jobs passed - use all jobs for context
             failed_jobs = jobs
 
-        for job in failed_jobs:
+        # Each log download is an independent gh round-trip, so run them
+        # concurrently; map() keeps the results in job order.
+        with ThreadPoolExecutor(max_workers=LOG_FETCH_WORKERS) as executor:
+            job_logs = list(
+                executor.map(
+                    lambda job_id: fetch_job_logs(repo, job_id) if job_id else "",
+                    [job.get("id", 0) for job in failed_jobs],
+                )
+            )
+
+        for job, log in zip(failed_jobs, job_logs):
             job_name = job.get("name", "unknown")
-            job_id = job.get("id", 0)
             conclusion = job.get("conclusion", "unknown")
 
             if conclusion == "failure":
                 failed_job_names.append(job_name)
 
-            if job_id:
-                log = fetch_job_logs(repo, job_id)
-                if log:
-                    all_logs += f"\n--- Job: {job_name} ---\n{log}\n"
+            if log:
+                log_parts.append(f"\n--- Job: {job_name} ---\n{log}\n")
 
         all_annotations = fetch_run_annotations(repo, run_id)
 
+    all_logs = "".join(log_parts)
+
     # --- Analyze ---
     findings = classify_failures(all_logs, all_annotations)
     failed_tests = extract_failed_tests(all_logs)
@@ -689,7 +823,7 @@ def main() -> int:  # noqa: C901
         action = "update" if prompt_name in existing_stems else "create"
 
         if not args.dry_run:
-            filepath.write_text(prompt_content, encoding="utf-8")
+            filepath.write_bytes(prompt_content.encode("utf-8"))
             print(f"  [{action.upper()}] {filepath}")
         else:
             print(f"  [DRY-RUN {action.upper()}] {filepath}")
@@ -722,7 +856,7 @@ def main() -> int:  # noqa: C901
 
     action = "update" if summary_name in existing_stems else "create"
     if not args.dry_run:
-        summary_path.write_text(summary_content, encoding="utf-8")
+        summary_path.write_bytes(summary_content.encode("utf-8"))
         print(f"  [{action.upper()}] {summary_path}")
     else:
         print(f"  [DRY-RUN {action.upper()}] {summary_path}")
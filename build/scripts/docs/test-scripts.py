@@ -11,14 +11,22 @@ Tests:
 - Script responds to --help
 - Script has required arguments
 - Script returns correct exit codes
+- Metrics dashboard counts every result in a sample .trx file
+- Health dashboard finds git dates for Windows-style relative paths
 
 Usage:
     python3 test-scripts.py
 """
 
+import importlib.util
+import os
 import subprocess
 import sys
+import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
+from types import ModuleType
+from unittest import mock
 from typing import List, Tuple
 
 
@@ -63,6 +71,91 @@ def test_script(script_path: Path) -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
+def _load_script(script_path: Path, module_name: str) -> ModuleType:
+    """Import a hyphen-named script from *script_path* as *module_name*."""
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses look their module up in sys.modules while being defined.
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Results in logger order: attributes are not in a fixed order and the
+# NotExecuted result has no duration, as the TRX logger omits zero ones.
+SAMPLE_TRX = """<?xml version="1.0" encoding="utf-8"?>
+<TestRun xmlns="http://microsoft.com/schemas/VisualStudio/TeamTest/2010">
+  <Results>
+    <UnitTestResult testName="Passes" duration="00:00:00.2500000" outcome="Passed" />
+    <UnitTestResult outcome="Failed" testName="Fails" duration="00:00:01.0000000">
+      <Output><ErrorInfo><Message>boom</Message></ErrorInfo></Output>
+    </UnitTestResult>
+    <UnitTestResult testName="Skipped" outcome="NotExecuted" />
+  </Results>
+</TestRun>
+"""
+
+
+def test_trx_parsing(scripts_dir: Path) -> Tuple[bool, List[str]]:
+    """Check generate-metrics-dashboard.py against SAMPLE_TRX.
+
+    Returns:
+        (success, errors) tuple
+    """
+    script_path = scripts_dir / 'generate-metrics-dashboard.py'
+    try:
+        module = _load_script(script_path, 'metrics_dashboard')
+        with tempfile.TemporaryDirectory() as tmp:
+            results_dir = Path(tmp) / 'TestResults'
+            results_dir.mkdir()
+            (results_dir / 'sample.trx').write_text(SAMPLE_TRX, encoding='utf-8')
+            metrics = module._parse_test_results(Path(tmp), lookback_days=1)
+    except Exception as e:
+        return False, [f"{script_path.name}: .trx parsing failed: {e}"]
+
+    expected = {
+        'total_tests': 3,
+        'passed_tests': 1,
+        'failed_tests': 1,
+        'skipped_tests': 1,
+        'avg_duration_ms': 1250 / 3,
+    }
+    errors = [
+        f"{script_path.name}: {field} is {getattr(metrics, field)!r}, expected {value!r}"
+        for field, value in expected.items()
+        if abs(getattr(metrics, field) - value) > 1e-6
+    ]
+    return len(errors) == 0, errors
+
+
+def test_git_date_lookup(scripts_dir: Path) -> Tuple[bool, List[str]]:
+    """Check generate-health-dashboard.py looks up ``\\``-separated paths.
+
+    Git reports paths with ``/``; on Windows the walk yields ``os.sep``.
+
+    Returns:
+        (success, errors) tuple
+    """
+    script_path = scripts_dir / 'generate-health-dashboard.py'
+    commit_date = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    try:
+        module = _load_script(script_path, 'health_dashboard')
+        with mock.patch.object(os, 'sep', '\\'):
+            key = module._git_path('docs\\guides\\setup.md')
+            found = module._last_modified(
+                None, 'docs\\guides\\setup.md', {'docs/guides/setup.md': commit_date}
+            )
+    except Exception as e:
+        return False, [f"{script_path.name}: git date lookup failed: {e}"]
+
+    errors = []
+    if key != 'docs/guides/setup.md':
+        errors.append(f"{script_path.name}: _git_path returned {key!r}")
+    if found != commit_date:
+        errors.append(f"{script_path.name}: _last_modified returned {found!r}")
+    return len(errors) == 0, errors
+
+
 def main() -> int:
     """Run all tests."""
     scripts_dir = Path(__file__).parent
@@ -97,6 +190,23 @@ def main() -> int:
                 total_errors.append(error)
             failed += 1
 
+    checks = [
+        ('.trx parsing', test_trx_parsing),
+        ('git date lookup', test_git_date_lookup),
+    ]
+    for label, check in checks:
+        success, errors = check(scripts_dir)
+
+        if success:
+            print(f"✓ {label}")
+            passed += 1
+        else:
+            print(f"✗ {label}")
+            for error in errors:
+                print(f"  - {error}")
+                total_errors.append(error)
+            failed += 1
+
     print()
     print(f"Results: {passed} passed, {failed} failed")
 